@@ -1,27 +1,77 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional, Dict
 
 import httpx
+import orjson
 from zoneinfo import ZoneInfo
 
 from .config import get_settings
 
+try:
+  import h2  # noqa: F401  (enables HTTP/2 in httpx)
+  _HTTP2_AVAILABLE = True
+except ImportError:
+  _HTTP2_AVAILABLE = False
+
+# Process-wide pooled client: keep-alive connections are reused across requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+  """Return the shared AsyncClient, creating it on first use."""
+  global _http_client
+  if _http_client is None or _http_client.is_closed:
+    _http_client = httpx.AsyncClient(
+      limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+      http2=_HTTP2_AVAILABLE,
+      timeout=get_settings().http_timeout_seconds,
+    )
+  return _http_client
+
+
+async def close_http_client() -> None:
+  """Close the shared AsyncClient (call on application shutdown)."""
+  global _http_client
+  if _http_client is not None:
+    await _http_client.aclose()
+    _http_client = None
+
+
+@dataclass(slots=True)
+class ExternalPayload:
+  """Birth details in FreeAstrologyAPI's request format (orjson serializes it directly)"""
+  year: int
+  month: int
+  date: int
+  hours: int
+  minutes: int
+  seconds: int
+  latitude: float
+  longitude: float
+  timezone: float
+  ayanamsa: str = "lahiri"
+
 
 class FreeAstrologyApiError(Exception):
   """Raised when FreeAstrologyAPI responds with an error."""
 
 
 class FreeAstrologyApiClient:
-  def __init__(self, timeout: Optional[float] = None) -> None:
+  def __init__(
+    self,
+    timeout: Optional[float] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+  ) -> None:
     settings = get_settings()
     self._base_url = settings.free_api_base_url.rstrip("/")
     self._timeout = timeout or settings.http_timeout_seconds
     self._api_key = settings.free_api_key
     self._settings = settings
+    self._http_client = http_client
 
   async def get_daily_horoscope_data(
     self,
@@ -72,23 +122,28 @@ class FreeAstrologyApiClient:
       "ayanamsa": "lahiri",
     }
 
-  async def _post(self, path: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+  async def _post(self, path: str, payload: Mapping[str, Any] | ExternalPayload) -> Mapping[str, Any]:
     headers = {
       "Accept": "application/json",
       "Content-Type": "application/json",
       "x-api-key": self._api_key,
     }
 
-    async with httpx.AsyncClient(timeout=self._timeout) as client:
-      response = await client.post(f"{self._base_url}{path}", json=payload, headers=headers)
+    client = self._http_client or get_http_client()
+    response = await client.post(
+      f"{self._base_url}{path}",
+      content=orjson.dumps(payload, default=dict),  # default: non-dict Mappings
+      headers=headers,
+      timeout=self._timeout,
+    )
 
-      if response.status_code >= 400:
-        raise FreeAstrologyApiError(f"FreeAstrology API error {response.status_code}: {response.text}")
+    if response.status_code >= 400:
+      raise FreeAstrologyApiError(f"FreeAstrology API error {response.status_code}: {response.text}")
 
-      try:
-        return response.json()
-      except json.JSONDecodeError as exc:
-        raise FreeAstrologyApiError(f"Unable to decode FreeAstrology API response: {exc}") from exc
+    try:
+      return orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
+      raise FreeAstrologyApiError(f"Unable to decode FreeAstrology API response: {exc}") from exc
 
 
 def _parse_date(raw: str, zone: ZoneInfo) -> datetime | None:
@@ -29,11 +29,27 @@ class Settings(BaseSettings):
 
   # HTTP settings
   http_timeout_seconds: float = 8.0
+
+  # Logging: "text" (human readable) or "json" (one object per line)
+  log_format: str = "text"
+
+  # HYBRID mode: head start given to the internal engine before the external
+  # API is also queried (hedged request); 0 races both backends immediately.
+  # Each hedged call spends external quota (50 req/day on the free tier) even
+  # when internal is merely slow, e.g. on a busy CPU pool; raise this to
+  # protect the quota. No hedge is made until the ephemeris has loaded.
+  hybrid_hedge_delay_seconds: float = 0.5
   app_port: int = 4001
 
   model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
   return Settings()
+
+
+def reload_settings() -> Settings:
+  """Drop the cached settings and re-read them from the environment"""
+  get_settings.cache_clear()
+  return get_settings()
@@ -0,0 +1,113 @@
+"""
+Batch Birth Chart Calculation
+
+Computes many birth charts in one pass. Inputs are stacked into (N,)
+arrays, and the time conversion, ephemeris lookups, ascendants and house
+assignment each run once over the whole batch, so the per-chart cost is
+mostly building the response dicts.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from .planetary import (
+    calculate_planet_positions_batch,
+    calculate_lahiri_ayanamsha,
+    calculate_rahu_ketu,
+    PLANET_INDEX,
+    _planet_record,
+)
+from .houses import (
+    local_to_julian_date_batch,
+    calculate_ascendants_batch,
+    calculate_houses_whole_sign,
+)
+
+_INPUT_FIELDS = (
+    'year', 'month', 'date', 'hours', 'minutes', 'seconds',
+    'latitude', 'longitude', 'timezone',
+)
+
+
+def calculate_birth_charts_batch(inputs: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Calculate whole-sign birth charts for many sets of birth details
+
+    Each input carries the /planets request fields (year, month, date, hours,
+    minutes, seconds, latitude, longitude, timezone). As in /planets,
+    positions are topocentric with Lahiri ayanamsha: `observation_point`
+    and `ayanamsha` are not read.
+
+    Args:
+        inputs: Birth details, one mapping per chart
+
+    Returns:
+        List of {"ascendant", "planets", "houses"} dicts, in input order
+
+    Raises:
+        ValueError: If any input is not a valid calendar date and time
+    """
+    if not inputs:
+        return []
+
+    # The JD kernel would silently roll impossible dates over (Feb 31 -> Mar 3)
+    for i, chart in enumerate(inputs):
+        try:
+            datetime(
+                chart.get('year', 0), chart.get('month', 0), chart.get('date', 0),
+                chart.get('hours', 0), chart.get('minutes', 0), chart.get('seconds', 0),
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid date in chart {i}: {e}") from e
+
+    columns = {
+        field: np.array([chart.get(field, 0) for chart in inputs])
+        for field in _INPUT_FIELDS
+    }
+    latitude = columns['latitude'].astype(np.float64)
+    longitude = columns['longitude'].astype(np.float64)
+
+    jd = local_to_julian_date_batch(
+        columns['year'], columns['month'], columns['date'],
+        columns['hours'], columns['minutes'], columns['seconds'],
+        columns['timezone'],
+    )
+
+    longitudes, speeds = calculate_planet_positions_batch(jd, latitude, longitude)
+    ascendants = calculate_ascendants_batch(
+        jd, latitude, longitude, calculate_lahiri_ayanamsha(jd)
+    )
+
+    # Whole-sign houses: offset of each body's sign from the ascendant's sign
+    # (from the 6-decimal longitudes reported, as assign_planets_to_houses does)
+    asc_signs = (ascendants / 30).astype(np.int64)
+    planet_signs = (np.round(longitudes, 6) / 30).astype(np.int64)
+    planet_houses = ((planet_signs - asc_signs[:, None]) % 12) + 1
+
+    names = list(PLANET_INDEX)
+    moon_idx = PLANET_INDEX['Moon']
+    charts = []
+
+    for asc, lons, spds, house_row in zip(
+        ascendants.tolist(), longitudes.tolist(), speeds.tolist(), planet_houses.tolist()
+    ):
+        planets = [_planet_record(name, lon, spd) for name, lon, spd in zip(names, lons, spds)]
+        for planet, house in zip(planets, house_row):
+            planet['house'] = house
+
+        # Rahu/Ketu from the Moon, housed the same way
+        houses = calculate_houses_whole_sign(asc)
+        first_house_sign = int(houses[0]['degree'] / 30)
+        for node in calculate_rahu_ketu(planets[moon_idx]):
+            node['house'] = ((int(node['fullDegree'] / 30) - first_house_sign) % 12) + 1
+            planets.append(node)
+
+        charts.append({
+            "ascendant": asc,
+            "planets": planets,
+            "houses": houses,
+        })
+
+    return charts
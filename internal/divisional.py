@@ -11,8 +11,9 @@ Calculates various divisional charts used in Vedic astrology:
 - D12 (Dwadasamsa) - Parents
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
 import logging
+import numbers
 
 logger = logging.getLogger(__name__)
 
@@ -203,47 +204,42 @@ def get_d12_position(longitude: float) -> Dict[str, Any]:
     }
 
 
-def calculate_divisional_charts(planets_list: List[Dict], ascendant_lon: float) -> Dict[str, Any]:
+# Chart key -> (name, purpose, position calculator), in response order
+DIVISIONAL_CHARTS = {
+    "D1": ("Rashi", "Physical body, general life", get_d1_position),
+    "D2": ("Hora", "Wealth and prosperity", get_d2_position),
+    "D3": ("Drekkana", "Siblings and courage", get_d3_position),
+    "D7": ("Saptamsa", "Children and progeny", get_d7_position),
+    "D9": ("Navamsa", "Marriage, spouse, dharma, soul purpose", get_d9_position),
+    "D10": ("Dasamsa", "Career and profession", get_d10_position),
+    "D12": ("Dwadasamsa", "Parents and ancestors", get_d12_position),
+}
+
+PRIMARY_CHARTS = ["D1", "D9", "D10"]
+
+
+def iter_divisional_charts(
+    planets_list: List[Dict], ascendant_lon: float
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
     """
-    Calculate all major divisional charts for a birth chart.
+    Iterate over divisional charts one at a time.
+    
+    Each chart is computed only when requested, so callers can serialize
+    and send D1 before the later charts exist.
     
     Args:
         planets_list: List of planet data with name, fullDegree
         ascendant_lon: Ascendant (Lagna) longitude
     
     Returns:
-        Dictionary with all divisional chart positions
-    """
-    charts = {
-        "D1": {"name": "Rashi", "purpose": "Physical body, general life"},
-        "D2": {"name": "Hora", "purpose": "Wealth and prosperity"},
-        "D3": {"name": "Drekkana", "purpose": "Siblings and courage"},
-        "D7": {"name": "Saptamsa", "purpose": "Children and progeny"},
-        "D9": {"name": "Navamsa", "purpose": "Marriage, spouse, dharma, soul purpose"},
-        "D10": {"name": "Dasamsa", "purpose": "Career and profession"},
-        "D12": {"name": "Dwadasamsa", "purpose": "Parents and ancestors"},
-    }
-    
-    # Calculate for each chart
-    for chart_key in charts:
-        charts[chart_key]["positions"] = {}
-    
-    # Add ascendant to all charts
-    asc_positions = {
-        "D1": get_d1_position(ascendant_lon),
-        "D2": get_d2_position(ascendant_lon),
-        "D3": get_d3_position(ascendant_lon),
-        "D7": get_d7_position(ascendant_lon),
-        "D9": get_d9_position(ascendant_lon),
-        "D10": get_d10_position(ascendant_lon),
-        "D12": get_d12_position(ascendant_lon),
-    }
+        Iterator of (chart key, chart data) tuples in DIVISIONAL_CHARTS order
     
-    for chart_key, pos in asc_positions.items():
-        charts[chart_key]["positions"]["Ascendant"] = pos
-        charts[chart_key]["ascendant_sign"] = pos["sign"]
-    
-    # Calculate for each planet
+    Raises:
+        ValueError: If a planet's longitude is not a number. Raised by this
+            call itself, before any chart is yielded, so a streaming caller
+            can still reject the request.
+    """
+    bodies = []
     for planet in planets_list:
         name = planet.get("name", "")
         lon = planet.get("fullDegree", planet.get("full_degree", 0))
@@ -251,18 +247,48 @@ def calculate_divisional_charts(planets_list: List[Dict], ascendant_lon: float)
         if not name or lon is None:
             continue
         
-        charts["D1"]["positions"][name] = get_d1_position(lon)
-        charts["D2"]["positions"][name] = get_d2_position(lon)
-        charts["D3"]["positions"][name] = get_d3_position(lon)
-        charts["D7"]["positions"][name] = get_d7_position(lon)
-        charts["D9"]["positions"][name] = get_d9_position(lon)
-        charts["D10"]["positions"][name] = get_d10_position(lon)
-        charts["D12"]["positions"][name] = get_d12_position(lon)
+        if not isinstance(lon, numbers.Real):
+            raise ValueError(f"Invalid fullDegree for {name}: {lon!r}")
+        
+        bodies.append((name, lon))
     
+    return _iter_charts(bodies, ascendant_lon)
+
+
+def _iter_charts(
+    bodies: List[Tuple[str, float]], ascendant_lon: float
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Lazily compute each divisional chart for validated (name, longitude) bodies"""
+    for chart_key, (chart_name, purpose, position_fn) in DIVISIONAL_CHARTS.items():
+        # Ascendant first, then each planet
+        asc_position = position_fn(ascendant_lon)
+        positions = {"Ascendant": asc_position}
+        for name, lon in bodies:
+            positions[name] = position_fn(lon)
+        
+        yield chart_key, {
+            "name": chart_name,
+            "purpose": purpose,
+            "positions": positions,
+            "ascendant_sign": asc_position["sign"],
+        }
+
+
+def calculate_divisional_charts(planets_list: List[Dict], ascendant_lon: float) -> Dict[str, Any]:
+    """
+    Calculate all major divisional charts for a birth chart.
+    
+    Args:
+        planets_list: List of planet data with name, fullDegree
+        ascendant_lon: Ascendant (Lagna) longitude
+    
+    Returns:
+        Dictionary with all divisional chart positions
+    """
     return {
-        "charts": charts,
-        "available_charts": ["D1", "D2", "D3", "D7", "D9", "D10", "D12"],
-        "primary_charts": ["D1", "D9", "D10"],
+        "charts": dict(iter_divisional_charts(planets_list, ascendant_lon)),
+        "available_charts": list(DIVISIONAL_CHARTS),
+        "primary_charts": list(PRIMARY_CHARTS),
         "backend": "internal",
     }
 
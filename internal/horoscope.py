@@ -62,7 +62,7 @@ def calculate_daily_transits(
         List of planet dictionaries with positions
     """
     try:
-        from .planetary import calculate_planet_positions, calculate_rahu_ketu
+        from .planetary import calculate_planet_positions, calculate_rahu_ketu, PLANET_INDEX
         
         # Use noon on the given date for transits
         transit_dt = datetime(
@@ -75,10 +75,9 @@ def calculate_daily_transits(
         )
         
         # Add Rahu/Ketu
-        moon = next((p for p in planets if p['name'] == 'Moon'), None)
-        if moon:
-            rahu, ketu = calculate_rahu_ketu(moon)
-            planets.extend([rahu, ketu])
+        moon = planets[PLANET_INDEX['Moon']]
+        rahu, ketu = calculate_rahu_ketu(moon)
+        planets.extend([rahu, ketu])
         
         return planets
         
@@ -136,6 +135,25 @@ def generate_daily_horoscope(
         transits = calculate_daily_transits(date)
     
     # Analyze transits relative to this sign
+    transit_aspects = analyze_transits_for_sign(transits, natal_sign_idx)
+    
+    # Generate guidance based on transits
+    guidance = generate_guidance(transit_aspects, sign_name)
+    
+    return _build_horoscope(sign_name, date, transit_aspects, guidance)
+
+
+def analyze_transits_for_sign(transits: List[Dict], natal_sign_idx: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Determine each transiting planet's aspect to a natal sign.
+    
+    Args:
+        transits: Planet dictionaries from calculate_daily_transits
+        natal_sign_idx: Index of the natal sign in ZODIAC_SIGNS
+        
+    Returns:
+        Dictionary of planet name -> sign, degree, aspect and retrograde flag
+    """
     transit_aspects = {}
     for planet in transits:
         planet_sign = planet.get("sign", "").lower()
@@ -160,9 +178,16 @@ def generate_daily_horoscope(
                 "is_retro": bool(is_retro),
             }
     
-    # Generate guidance based on transits
-    guidance = generate_guidance(transit_aspects, sign_name)
-    
+    return transit_aspects
+
+
+def _build_horoscope(
+    sign_name: str,
+    date: datetime,
+    transit_aspects: Dict[str, Dict[str, Any]],
+    guidance: Dict[str, str],
+) -> Dict[str, Any]:
+    """Assemble the horoscope response for one sign."""
     # Calculate ratings based on aspects
     ratings = calculate_ratings(transit_aspects)
     
@@ -273,15 +298,27 @@ def generate_batch_horoscopes(
     Returns:
         Dictionary with all 12 sign horoscopes
     """
+    from .templates import get_all_guidance
+    
     # Calculate transits once
     transits = calculate_daily_transits(date)
     
+    transits_by_sign = {
+        sign.lower(): analyze_transits_for_sign(transits, idx)
+        for idx, sign in enumerate(ZODIAC_SIGNS)
+    }
+    
+    # Generate guidance for all 12 signs in one batch
+    guidance_by_sign = get_all_guidance(transits_by_sign)
+    
     result = {}
     for sign in ZODIAC_SIGNS:
-        result[sign.lower()] = generate_daily_horoscope(
-            sign=sign,
-            date=date,
-            transits=transits,
+        key = sign.lower()
+        result[key] = _build_horoscope(
+            sign,
+            date,
+            transits_by_sign[key],
+            guidance_by_sign[key],
         )
     
     return result
@@ -8,30 +8,27 @@ Supports Whole Sign and Placidus house systems.
 import math
 from datetime import datetime, timezone
 from typing import List, Dict
-from .signs import get_sign_name
 
+import numpy as np
 
-def datetime_to_julian_date(dt: datetime) -> float:
-    """
-    Convert datetime to Julian Date
+from .jit import njit
+from .signs import get_sign_name
 
-    Args:
-        dt: Datetime object (UTC)
+# J2000.0 epoch (Jan 1, 2000, 12:00 UT)
+JD2000 = 2451545.0
 
-    Returns:
-        Julian Date as float
-    """
-    # Ensure UTC
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt = dt.astimezone(timezone.utc)
+# Mean obliquity of the ecliptic for epoch J2000.0: 23.4392911°
+# For better accuracy, should adjust for date, but this is close enough for MVP
+OBLIQUITY = 23.4397
 
-    # Julian Date calculation
-    year = dt.year
-    month = dt.month
-    day = dt.day
 
+# ==============================================================================
+# NUMERIC KERNELS (compiled with Numba when available)
+# ==============================================================================
+
+@njit("float64(int64, int64, int64, int64, int64, float64)", cache=True, error_model='numpy')
+def _julian_date_kernel(year: int, month: int, day: int, hour: int, minute: int, second: int) -> float:
+    """Julian Date from UTC calendar fields (Gregorian calendar)."""
     # Adjust for January/February
     if month <= 2:
         year -= 1
@@ -43,38 +40,152 @@ def datetime_to_julian_date(dt: datetime) -> float:
     jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
 
     # Add time fraction
-    time_fraction = (dt.hour + dt.minute / 60.0 + dt.second / 3600.0) / 24.0
-    jd += time_fraction
+    time_fraction = (hour + minute / 60.0 + second / 3600.0) / 24.0
+    return jd + time_fraction
+
 
-    return jd
+@njit("float64(float64, float64)", cache=True, error_model='numpy')
+def _local_sidereal_time_kernel(jd: float, longitude: float) -> float:
+    """Local Sidereal Time in hours (0-24); longitude 0 gives GST."""
+    # Mean sidereal time at Greenwich (simplified formula)
+    # GST at 0h UT = 18.697374558 + 24.06570982441908 * D
+    gst = (18.697374558 + 24.06570982441908 * (jd - JD2000)) % 24.0
 
+    # Longitude correction: 1 degree = 4 minutes of time = 1/15 hour
+    return (gst + longitude / 15.0) % 24.0
 
-def calculate_greenwich_sidereal_time(dt: datetime) -> float:
+
+@njit("float64(float64, float64, float64, float64)", cache=True, error_model='numpy')
+def _ascendant_kernel(jd: float, latitude: float, longitude: float, ayanamsha: float) -> float:
+    """Sidereal ascendant longitude (0-360) at a Julian Date and place."""
+    # RAMC - Right Ascension of Midheaven, in degrees
+    ramc_rad = math.radians(_local_sidereal_time_kernel(jd, longitude) * 15.0)
+    lat_rad = math.radians(latitude)
+    eps_rad = math.radians(OBLIQUITY)
+
+    # tan(Asc) = -cos(RAMC) / (sin(RAMC) * cos(ε) + tan(lat) * sin(ε))
+    numerator = -math.cos(ramc_rad)
+    denominator = (
+        math.sin(ramc_rad) * math.cos(eps_rad) +
+        math.tan(lat_rad) * math.sin(eps_rad)
+    )
+
+    asc_tropical = math.degrees(math.atan2(numerator, denominator)) % 360
+    return (asc_tropical - ayanamsha) % 360
+
+
+@njit("float64(float64, float64, float64)", cache=True, error_model='numpy')
+def _midheaven_kernel(jd: float, longitude: float, ayanamsha: float) -> float:
+    """Sidereal Midheaven longitude (0-360) at a Julian Date and place."""
+    ramc_rad = math.radians(_local_sidereal_time_kernel(jd, longitude) * 15.0)
+    eps_rad = math.radians(OBLIQUITY)
+
+    # tan(MC) = tan(RAMC) / cos(ε)
+    mc_tropical = math.degrees(math.atan2(math.tan(ramc_rad), math.cos(eps_rad))) % 360
+    return (mc_tropical - ayanamsha) % 360
+
+
+@njit(
+    "float64[:](int64[:], int64[:], int64[:], int64[:], int64[:], int64[:], float64[:])",
+    cache=True, error_model='numpy',
+)
+def _julian_date_batch_kernel(
+    year: np.ndarray,
+    month: np.ndarray,
+    day: np.ndarray,
+    hour: np.ndarray,
+    minute: np.ndarray,
+    second: np.ndarray,
+    tz_offset_hours: np.ndarray
+) -> np.ndarray:
+    """Julian Dates (UTC) from arrays of local calendar fields and UTC offsets."""
+    out = np.empty(year.shape[0])
+    for i in range(year.shape[0]):
+        out[i] = _julian_date_kernel(
+            year[i], month[i], day[i], hour[i], minute[i], second[i]
+        ) - tz_offset_hours[i] / 24.0
+    return out
+
+
+@njit(
+    "float64[:](float64[:], float64[:], float64[:], float64[:])",
+    cache=True, error_model='numpy',
+)
+def _ascendant_batch_kernel(
+    jd: np.ndarray,
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    ayanamsha: np.ndarray
+) -> np.ndarray:
+    """Sidereal ascendants for arrays of Julian Dates and places."""
+    out = np.empty(jd.shape[0])
+    for i in range(jd.shape[0]):
+        out[i] = _ascendant_kernel(jd[i], latitude[i], longitude[i], ayanamsha[i])
+    return out
+
+
+def _to_utc(dt: datetime) -> datetime:
+    """Treat naive datetimes as UTC; convert aware ones to UTC."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def datetime_to_julian_date(dt: datetime) -> float:
     """
-    Calculate Greenwich Sidereal Time in hours (0-24)
+    Convert datetime to Julian Date
 
     Args:
         dt: Datetime object (UTC)
 
     Returns:
-        Greenwich Sidereal Time in hours
+        Julian Date as float
     """
-    jd = datetime_to_julian_date(dt)
+    dt = _to_utc(dt)
+    return _julian_date_kernel(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+
+def local_to_julian_date(
+    year: int,
+    month: int,
+    day: int,
+    hours: int,
+    minutes: int,
+    seconds: float,
+    tz_offset_hours: float
+) -> float:
+    """
+    Convert local civil time fields straight to a (UTC) Julian Date
 
-    # J2000.0 epoch (Jan 1, 2000, 12:00 UT)
-    jd2000 = 2451545.0
+    Equivalent to building a datetime, subtracting the UTC offset and calling
+    datetime_to_julian_date, without the timedelta arithmetic.
 
-    # Days since J2000
-    d = jd - jd2000
+    Args:
+        year, month, day, hours, minutes, seconds: Local date and time
+        tz_offset_hours: Local UTC offset in hours (e.g. 5.5 for IST)
 
-    # Mean sidereal time at Greenwich (simplified formula)
-    # GST at 0h UT = 18.697374558 + 24.06570982441908 * D
-    gst = 18.697374558 + 24.06570982441908 * d
+    Returns:
+        Julian Date as float
+
+    Raises:
+        ValueError: If the fields are not a valid calendar date and time
+    """
+    # Validate as datetime() would; the kernel silently rolls over (Feb 31 -> Mar 3)
+    datetime(year, month, day, hours, minutes, int(seconds))
+    return _julian_date_kernel(year, month, day, hours, minutes, seconds) - tz_offset_hours / 24.0
 
-    # Normalize to 0-24 hours
-    gst = gst % 24.0
 
-    return gst
+def calculate_greenwich_sidereal_time(dt: datetime) -> float:
+    """
+    Calculate Greenwich Sidereal Time in hours (0-24)
+
+    Args:
+        dt: Datetime object (UTC)
+
+    Returns:
+        Greenwich Sidereal Time in hours
+    """
+    return _local_sidereal_time_kernel(datetime_to_julian_date(dt), 0.0)
 
 
 def calculate_local_sidereal_time(dt: datetime, longitude: float) -> float:
@@ -88,16 +199,7 @@ def calculate_local_sidereal_time(dt: datetime, longitude: float) -> float:
     Returns:
         Local Sidereal Time in hours
     """
-    # Greenwich Sidereal Time
-    gst = calculate_greenwich_sidereal_time(dt)
-
-    # Longitude correction: 1 degree = 4 minutes of time = 1/15 hour
-    longitude_hours = longitude / 15.0
-
-    # Local Sidereal Time
-    lst = (gst + longitude_hours) % 24.0
-
-    return lst
+    return _local_sidereal_time_kernel(datetime_to_julian_date(dt), longitude)
 
 
 def calculate_ascendant(
@@ -121,42 +223,17 @@ def calculate_ascendant(
     Returns:
         Sidereal ascendant longitude in degrees (0-360)
     """
-    # Local Sidereal Time
-    lst = calculate_local_sidereal_time(dt, longitude)
-
-    # Convert LST to degrees (RAMC - Right Ascension of Midheaven)
-    ramc = lst * 15.0  # hours to degrees
-
-    # Obliquity of the ecliptic (Earth's axial tilt)
-    # Mean obliquity for epoch J2000.0: 23.4392911°
-    # For better accuracy, should adjust for date, but this is close enough for MVP
-    epsilon = 23.4397
-
-    # Convert to radians
-    ramc_rad = math.radians(ramc)
-    lat_rad = math.radians(latitude)
-    eps_rad = math.radians(epsilon)
-
-    # Ascendant formula (Placidus/standard method)
-    # tan(Asc) = -cos(RAMC) / (sin(RAMC) * cos(ε) + tan(lat) * sin(ε))
+    return _ascendant_kernel(datetime_to_julian_date(dt), latitude, longitude, ayanamsha)
 
-    numerator = -math.cos(ramc_rad)
-    denominator = (
-        math.sin(ramc_rad) * math.cos(eps_rad) +
-        math.tan(lat_rad) * math.sin(eps_rad)
-    )
-
-    # Calculate ascendant in ecliptic longitude (tropical)
-    asc_tropical_rad = math.atan2(numerator, denominator)
-    asc_tropical = math.degrees(asc_tropical_rad)
 
-    # Normalize to 0-360
-    asc_tropical = asc_tropical % 360
-
-    # Convert tropical to sidereal
-    asc_sidereal = (asc_tropical - ayanamsha) % 360
-
-    return asc_sidereal
+def calculate_ascendant_jd(
+    jd: float,
+    latitude: float,
+    longitude: float,
+    ayanamsha: float
+) -> float:
+    """Same as calculate_ascendant, for a Julian Date (UTC)"""
+    return _ascendant_kernel(jd, latitude, longitude, ayanamsha)
 
 
 def calculate_midheaven(
@@ -177,29 +254,43 @@ def calculate_midheaven(
     Returns:
         Sidereal MC longitude in degrees (0-360)
     """
-    # Local Sidereal Time
-    lst = calculate_local_sidereal_time(dt, longitude)
-
-    # RAMC in degrees
-    ramc = lst * 15.0
-
-    # Obliquity of ecliptic
-    epsilon = 23.4397
-
-    # MC calculation (simplified)
-    # For a more accurate formula, we'd use:
-    # tan(MC) = tan(RAMC) / cos(ε)
-
-    ramc_rad = math.radians(ramc)
-    eps_rad = math.radians(epsilon)
-
-    mc_tropical_rad = math.atan2(math.tan(ramc_rad), math.cos(eps_rad))
-    mc_tropical = math.degrees(mc_tropical_rad) % 360
+    return _midheaven_kernel(datetime_to_julian_date(dt), longitude, ayanamsha)
+
+
+def local_to_julian_date_batch(
+    year: np.ndarray,
+    month: np.ndarray,
+    day: np.ndarray,
+    hours: np.ndarray,
+    minutes: np.ndarray,
+    seconds: np.ndarray,
+    tz_offset_hours: np.ndarray
+) -> np.ndarray:
+    """Vectorized local_to_julian_date over (N,) arrays"""
+    return _julian_date_batch_kernel(
+        np.asarray(year, dtype=np.int64),
+        np.asarray(month, dtype=np.int64),
+        np.asarray(day, dtype=np.int64),
+        np.asarray(hours, dtype=np.int64),
+        np.asarray(minutes, dtype=np.int64),
+        np.asarray(seconds, dtype=np.int64),
+        np.asarray(tz_offset_hours, dtype=np.float64),
+    )
 
-    # Convert to sidereal
-    mc_sidereal = (mc_tropical - ayanamsha) % 360
 
-    return mc_sidereal
+def calculate_ascendants_batch(
+    jd: np.ndarray,
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    ayanamsha: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_ascendant_jd over (N,) arrays"""
+    return _ascendant_batch_kernel(
+        np.asarray(jd, dtype=np.float64),
+        np.asarray(latitude, dtype=np.float64),
+        np.asarray(longitude, dtype=np.float64),
+        np.asarray(ayanamsha, dtype=np.float64),
+    )
 
 
 def calculate_houses_whole_sign(ascendant: float) -> List[Dict]:
@@ -316,32 +407,34 @@ def assign_planets_to_houses(
     Returns:
         Updated planets list with 'house' field populated
     """
-    for planet in planets:
-        planet_long = planet['fullDegree']
-
-        if house_system == 'whole_sign':
-            # In whole sign, house = sign offset from 1st house sign
-            planet_sign = int(planet_long / 30)
-            first_house_sign = int(houses[0]['degree'] / 30)
-            house = ((planet_sign - first_house_sign) % 12) + 1
-        else:
-            # Placidus: find which house the planet falls into
-            house = 1
-            for i in range(12):
-                cusp_this = houses[i]['degree']
-                cusp_next = houses[(i + 1) % 12]['degree']
-
-                # Handle wraparound at 0°/360°
-                if cusp_next < cusp_this:
-                    # House crosses 0° Aries
-                    if planet_long >= cusp_this or planet_long < cusp_next:
-                        house = i + 1
-                        break
-                else:
-                    if cusp_this <= planet_long < cusp_next:
-                        house = i + 1
-                        break
+    if not planets:
+        return planets
+
+    lons = np.fromiter((p['fullDegree'] for p in planets), dtype=np.float64, count=len(planets))
 
+    if house_system == 'whole_sign':
+        # In whole sign, house = sign offset from 1st house sign
+        planet_signs = (lons / 30).astype(np.int64)
+        first_house_sign = int(houses[0]['degree'] / 30)
+        house_nums = ((planet_signs - first_house_sign) % 12) + 1
+    else:
+        # Placidus: test every planet against every cusp span at once
+        cusp_this = np.array([h['degree'] for h in houses[:12]], dtype=np.float64)
+        cusp_next = np.roll(cusp_this, -1)
+        lon_col = lons[:, None]
+
+        # Spans where cusp_next < cusp_this cross 0° Aries
+        in_house = np.where(
+            cusp_next < cusp_this,
+            (lon_col >= cusp_this) | (lon_col < cusp_next),
+            (cusp_this <= lon_col) & (lon_col < cusp_next),
+        )
+
+        # First matching house, or house 1 if none match
+        house_nums = np.where(in_house.any(axis=1), in_house.argmax(axis=1) + 1, 1)
+
+    for planet, house in zip(planets, house_nums.tolist()):
         planet['house'] = house
 
     return planets
+
@@ -0,0 +1,43 @@
+"""
+Optional Numba JIT Support
+
+Numba compiles the numeric kernels in this package to native code when it is
+installed. Without it, `njit` is a no-op decorator and the kernels run as
+plain Python/NumPy, so the engine keeps working in slim environments.
+
+Kernels declare explicit signatures, so they compile (or load from the cache)
+at import. The cache lives in `.numba_cache/` at the project root, or in the
+temp directory when the project is read-only (e.g. serverless); set
+NUMBA_CACHE_DIR to override.
+"""
+
+import os
+import tempfile
+
+
+def _default_cache_dir() -> str:
+    """Project-level .numba_cache, or a temp dir if the project is read-only"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if os.access(project_root, os.W_OK):
+        return os.path.join(project_root, ".numba_cache")
+    return os.path.join(tempfile.gettempdir(), "numba_cache")
+
+
+# Must be set before numba is imported (it reads the environment once)
+os.environ.setdefault("NUMBA_CACHE_DIR", _default_cache_dir())
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
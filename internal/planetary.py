@@ -6,7 +6,12 @@ Calculates sidereal (Vedic) positions with Lahiri ayanamsha.
 """
 
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import threading
+
+import numpy as np
+
+from .jit import njit
 from .signs import longitude_to_sign
 from .nakshatras import longitude_to_nakshatra
 
@@ -16,52 +21,75 @@ _ts = None
 _earth = None
 _planets_map = None
 
+# Guards the one-time load when requests run on worker threads
+_ephemeris_lock = threading.Lock()
+
+# Vedic planet names and their Skyfield bodies, in the order
+# calculate_planet_positions returns them
+_PLANET_EPHEMERIS_KEYS = (
+    ('Sun', 'sun'),
+    ('Moon', 'moon'),
+    ('Mars', 'mars'),
+    ('Mercury', 'mercury'),
+    ('Jupiter', 'jupiter barycenter'),
+    ('Venus', 'venus'),
+    ('Saturn', 'saturn barycenter'),
+)
+
+# Position of each planet in the calculate_planet_positions result
+PLANET_INDEX = {name: i for i, (name, _) in enumerate(_PLANET_EPHEMERIS_KEYS)}
+
 
 def _ensure_ephemeris():
     """Lazy load Skyfield ephemeris data"""
     global _eph, _ts, _earth, _planets_map
 
+    # Fast path: already loaded (no lock taken per request)
     if _eph is not None:
         return
 
-    try:
-        import os
-        from skyfield.api import load, Loader
-
-        # Get the directory containing this module (internal/)
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        # Project root is one level up from internal/
-        project_root = os.path.dirname(module_dir)
-        
-        # Create a loader that looks in the project root for ephemeris files
-        loader = Loader(project_root)
-        
-        # Load ephemeris from project root (where de421.bsp is)
-        ephemeris_path = os.path.join(project_root, 'de421.bsp')
-        
-        if os.path.exists(ephemeris_path):
-            _eph = loader('de421.bsp')
-        else:
-            # Fallback: try to download (not ideal for serverless)
-            _eph = load('de421.bsp')
+    with _ephemeris_lock:
+        if _eph is not None:
+            return
+
+        try:
+            import os
+            from skyfield.api import load, Loader
+
+            # Get the directory containing this module (internal/)
+            module_dir = os.path.dirname(os.path.abspath(__file__))
+            # Project root is one level up from internal/
+            project_root = os.path.dirname(module_dir)
+            
+            # Create a loader that looks in the project root for ephemeris files
+            loader = Loader(project_root)
+            
+            # Load ephemeris from project root (where de421.bsp is)
+            ephemeris_path = os.path.join(project_root, 'de421.bsp')
             
-        _ts = load.timescale()
-        _earth = _eph['earth']
-
-        # Map Vedic planet names to Skyfield bodies
-        _planets_map = {
-            'Sun': _eph['sun'],
-            'Moon': _eph['moon'],
-            'Mars': _eph['mars'],
-            'Mercury': _eph['mercury'],
-            'Jupiter': _eph['jupiter barycenter'],
-            'Venus': _eph['venus'],
-            'Saturn': _eph['saturn barycenter'],
-        }
-    except ImportError:
-        raise ImportError(
-            "Skyfield not installed. Run: pip install skyfield"
-        )
+            if os.path.exists(ephemeris_path):
+                eph = loader('de421.bsp')
+            else:
+                # Fallback: try to download (not ideal for serverless)
+                eph = load('de421.bsp')
+                
+            _ts = load.timescale()
+            _earth = eph['earth']
+
+            # Map Vedic planet names to Skyfield bodies
+            _planets_map = {name: eph[key] for name, key in _PLANET_EPHEMERIS_KEYS}
+
+            # Publish last: the fast path treats _eph as "fully loaded"
+            _eph = eph
+        except ImportError:
+            raise ImportError(
+                "Skyfield not installed. Run: pip install skyfield"
+            )
+
+
+def ephemeris_loaded() -> bool:
+    """True once the ephemeris has been loaded (by a request or the startup warm-up)"""
+    return _eph is not None
 
 
 def calculate_lahiri_ayanamsha(jd: float) -> float:
@@ -79,6 +107,12 @@ def calculate_lahiri_ayanamsha(jd: float) -> float:
     Returns:
         Ayanamsha value in degrees
     """
+    return _lahiri_ayanamsha_kernel(jd)
+
+
+@njit(["float64(float64)", "float64[:](float64[:])"], cache=True, error_model='numpy')
+def _lahiri_ayanamsha_kernel(jd: float) -> float:
+    """Lahiri ayanamsha in degrees at a Julian Date (scalar or array)."""
     # Julian date for Jan 1, 1950, 0h UT
     jd_1950 = 2433282.5
 
@@ -87,9 +121,7 @@ def calculate_lahiri_ayanamsha(jd: float) -> float:
 
     # Lahiri ayanamsha formula
     # Base value at 1950 + annual precession
-    ayanamsha = 23.85 + (50.26 / 3600.0) * years_since_1950
-
-    return ayanamsha
+    return 23.85 + (50.26 / 3600.0) * years_since_1950
 
 
 def calculate_planet_speed(planet_body, time_obj, ts, interval_days: float = 1.0) -> float:
@@ -147,6 +179,42 @@ def calculate_planet_positions(
     """
     _ensure_ephemeris()
 
+    # Create time object (ensure UTC)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    else:
+        dt = dt.astimezone(timezone.utc)
+
+    return _planet_positions_at(_ts.from_datetime(dt), latitude, longitude, ayanamsha)
+
+
+def calculate_planet_positions_jd(
+    jd: float,
+    latitude: float,
+    longitude: float,
+    ayanamsha: str = 'lahiri'
+) -> List[Dict]:
+    """Same as calculate_planet_positions, for a Julian Date (UTC)"""
+    _ensure_ephemeris()
+    return _planet_positions_at(_utc_jd_time(jd), latitude, longitude, ayanamsha)
+
+
+def _utc_jd_time(jd):
+    """
+    Skyfield Time for a UTC Julian Date (scalar or array)
+
+    Built from the UTC calendar day and seconds into it, so leap seconds
+    (and Skyfield's pre-1972 UTC offset) apply exactly as in from_datetime.
+    Reading the JD as UT1 instead would be off by up to ~44s for old dates.
+    """
+    # Preceding UTC midnight, as a day offset from 2000-01-01 (JD 2451544.5)
+    midnight = np.floor(np.asarray(jd) - 0.5) + 0.5
+    seconds = np.round((jd - midnight) * 86400.0, 3)
+    return _ts.utc(2000, 1, 1 + (midnight - 2451544.5), 0, 0, seconds)
+
+
+def _planet_positions_at(t, latitude: float, longitude: float, ayanamsha: str) -> List[Dict]:
+    """Sidereal planet positions at a Skyfield Time for an observer"""
     from skyfield.api import Topos
 
     # Create observer location
@@ -155,14 +223,6 @@ def calculate_planet_positions(
         longitude_degrees=longitude
     )
 
-    # Create time object (ensure UTC)
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt = dt.astimezone(timezone.utc)
-
-    t = _ts.from_datetime(dt)
-
     # Calculate ayanamsha offset
     if ayanamsha.lower() == 'lahiri':
         ayanamsha_value = calculate_lahiri_ayanamsha(t.tt)
@@ -184,31 +244,83 @@ def calculate_planet_positions(
         # Convert tropical to sidereal
         sidereal_long = (tropical_long - ayanamsha_value) % 360
 
-        # Get sign information
-        sign_info = longitude_to_sign(sidereal_long)
-
-        # Get nakshatra information
-        nakshatra_info = longitude_to_nakshatra(sidereal_long)
-
         # Calculate speed
         speed = calculate_planet_speed(planet_body, t, _ts)
 
-        results.append({
-            'name': planet_name,
-            'fullDegree': round(sidereal_long, 6),
-            'normDegree': round(sign_info['norm_degree'], 6),
-            'speed': round(speed, 6),
-            'isRetro': speed < 0,
-            'sign': sign_info['sign_name'],
-            'signLord': sign_info['sign_lord'],
-            'nakshatra': nakshatra_info['nakshatra_name'],
-            'nakshatraLord': nakshatra_info['nakshatra_lord'],
-            'house': 0  # Will be calculated after ascendant is known
-        })
+        results.append(_planet_record(planet_name, sidereal_long, speed))
 
     return results
 
 
+def _planet_record(name: str, sidereal_long: float, speed: float) -> Dict:
+    """Build the planet position dict for a sidereal longitude and speed"""
+    # Get sign information
+    sign_info = longitude_to_sign(sidereal_long)
+
+    # Get nakshatra information
+    nakshatra_info = longitude_to_nakshatra(sidereal_long)
+
+    return {
+        'name': name,
+        'fullDegree': round(sidereal_long, 6),
+        'normDegree': round(sign_info['norm_degree'], 6),
+        'speed': round(speed, 6),
+        'isRetro': speed < 0,
+        'sign': sign_info['sign_name'],
+        'signLord': sign_info['sign_lord'],
+        'nakshatra': nakshatra_info['nakshatra_name'],
+        'nakshatraLord': nakshatra_info['nakshatra_lord'],
+        'house': 0  # Will be calculated after ascendant is known
+    }
+
+
+def calculate_planet_positions_batch(
+    jd: np.ndarray,
+    latitude: np.ndarray,
+    longitude: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sidereal (Lahiri) longitudes and speeds for many charts at once
+
+    Each Skyfield call covers the whole batch (one observer and time per
+    chart), instead of one call per chart and planet.
+
+    Args:
+        jd: Julian Dates (UTC), shape (N,)
+        latitude: Observer latitudes in degrees, shape (N,)
+        longitude: Observer longitudes in degrees, shape (N,)
+
+    Returns:
+        Tuple of (longitudes, speeds), each shape (N, 7) in PLANET_INDEX order
+    """
+    _ensure_ephemeris()
+
+    from skyfield.api import Topos
+
+    t = _utc_jd_time(jd)
+    t_prev = _ts.tt_jd(t.tt - 1.0)
+    observer_at_t = (_earth + Topos(latitude_degrees=latitude, longitude_degrees=longitude)).at(t)
+    earth_at_t = _earth.at(t)
+    earth_at_prev = _earth.at(t_prev)
+
+    ayanamsha_value = _lahiri_ayanamsha_kernel(t.tt)
+
+    n = len(jd)
+    longitudes = np.empty((n, len(_PLANET_EPHEMERIS_KEYS)))
+    speeds = np.empty((n, len(_PLANET_EPHEMERIS_KEYS)))
+
+    for i, planet_body in enumerate(_planets_map.values()):
+        tropical_long = observer_at_t.observe(planet_body).apparent().ecliptic_latlon()[1].degrees
+        longitudes[:, i] = (tropical_long - ayanamsha_value) % 360
+
+        # Geocentric daily motion, as in calculate_planet_speed
+        pos_now = earth_at_t.observe(planet_body).apparent().ecliptic_latlon()[1].degrees
+        pos_prev = earth_at_prev.observe(planet_body).apparent().ecliptic_latlon()[1].degrees
+        speeds[:, i] = (pos_now - pos_prev + 180) % 360 - 180
+
+    return longitudes, speeds
+
+
 def calculate_rahu_ketu(moon_position: Dict) -> tuple[Dict, Dict]:
     """
     Calculate Rahu and Ketu positions (lunar nodes)
@@ -269,3 +381,4 @@ def calculate_rahu_ketu(moon_position: Dict) -> tuple[Dict, Dict]:
     }
 
     return rahu, ketu
+
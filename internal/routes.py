@@ -6,15 +6,24 @@ drop-in replacement without frontend changes.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
 import logging
+import os
+
+import orjson
 
 from .planetary import (
     calculate_planet_positions,
     calculate_lahiri_ayanamsha,
-    calculate_rahu_ketu
+    calculate_rahu_ketu,
+    PLANET_INDEX
 )
 from .houses import (
     calculate_ascendant,
@@ -28,6 +37,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Shared pool for CPU-bound ephemeris/detector calls so they don't block the event loop
+_CPU_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+async def _off(fn, *args, **kwargs):
+    """Run a blocking calculation on the shared CPU pool and await its result"""
+    # Carry context (e.g. the request ID used in logs) into the worker thread
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _CPU_POOL, functools.partial(ctx.run, fn, *args, **kwargs)
+    )
+
 
 # Request Models (matching FreeAstrologyAPI)
 class AstrologyRequest(BaseModel):
@@ -80,7 +101,7 @@ async def get_birth_chart(request: AstrologyRequest):
     Matches FreeAstrologyAPI endpoint: POST /planets
     """
     try:
-        logger.info(f"Calculating birth chart for {request.year}-{request.month}-{request.date}")
+        logger.info("Calculating birth chart for %s-%s-%s", request.year, request.month, request.date)
 
         # Convert to UTC datetime
         # Subtract timezone offset to get UTC
@@ -120,19 +141,14 @@ async def get_birth_chart(request: AstrologyRequest):
         # Calculate houses (use Whole Sign for simplicity in MVP)
         houses = calculate_houses_whole_sign(ascendant)
 
-        # Assign planets to houses
-        planets = assign_planets_to_houses(planets, houses, 'whole_sign')
-
         # Add Rahu and Ketu (shadow planets)
-        moon = next((p for p in planets if p['name'] == 'Moon'), None)
-        if moon:
-            rahu, ketu = calculate_rahu_ketu(moon)
-            # Assign houses to Rahu/Ketu
-            rahu_ketu_list = [rahu, ketu]
-            rahu_ketu_list = assign_planets_to_houses(rahu_ketu_list, houses, 'whole_sign')
-            planets.extend(rahu_ketu_list)
+        moon = planets[PLANET_INDEX['Moon']]
+        planets.extend(calculate_rahu_ketu(moon))
+
+        # Assign all planets (including Rahu/Ketu) to houses in one pass
+        planets = assign_planets_to_houses(planets, houses, 'whole_sign')
 
-        logger.info(f"Birth chart calculated successfully. Ascendant: {ascendant:.2f}°")
+        logger.info("Birth chart calculated successfully. Ascendant: %.2f°", ascendant)
 
         return BirthChartResponse(
             input=request,
@@ -149,6 +165,48 @@ async def get_birth_chart(request: AstrologyRequest):
         )
 
 
+class BatchChartRequest(BaseModel):
+    """Birth details for many charts in one request"""
+    charts: List[AstrologyRequest] = Field(..., min_length=1, max_length=1000)
+
+
+@router.post("/chart/batch")
+async def get_birth_charts_batch(request: BatchChartRequest):
+    """
+    Calculate many birth charts in one vectorized pass
+
+    Charts come back in request order with the /planets ascendant, planets
+    and houses (without the echoed input). Like /planets, positions are
+    always topocentric Lahiri: each chart's ayanamsha and observation_point
+    are accepted but not applied. An impossible date in any chart (e.g.
+    Feb 31) rejects the whole batch with a 400.
+    """
+    try:
+        from .batch import calculate_birth_charts_batch
+
+        logger.info("Calculating %d birth charts in batch", len(request.charts))
+
+        charts = await _off(
+            calculate_birth_charts_batch,
+            [chart.model_dump() for chart in request.charts]
+        )
+
+        return {
+            "backend": "internal",
+            "count": len(charts),
+            "charts": charts,
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error calculating batch birth charts: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to calculate batch birth charts: {str(e)}"
+        )
+
+
 class ChartSvgRequest(AstrologyRequest):
     """Extended request with chart styling options"""
     chart_style: str = Field("north_indian", pattern="^(north_indian|south_indian)$")
@@ -194,7 +252,7 @@ async def get_chart_svg(request: ChartSvgRequest):
             size=size,
         )
         
-        logger.info(f"Generated {request.chart_style} chart SVG ({request.size}, {request.theme})")
+        logger.info("Generated %s chart SVG (%s, %s)", request.chart_style, request.size, request.theme)
         
         return {
             "statusCode": 200,
@@ -277,7 +335,7 @@ async def get_daily_horoscope(request: DailyHoroscopeRequest):
             date=target_date,
         )
         
-        logger.info(f"Generated daily horoscope for {request.sign}")
+        logger.info("Generated daily horoscope for %s", request.sign)
         
         return horoscope
         
@@ -327,7 +385,7 @@ async def get_batch_horoscopes(request: BatchHoroscopeRequest):
         # Generate all horoscopes
         horoscopes = generate_batch_horoscopes(date=target_date)
         
-        logger.info(f"Generated batch horoscopes for {target_date.strftime('%Y-%m-%d')}")
+        logger.info("Generated batch horoscopes for %s", target_date.date())
         
         return {
             "date": target_date.strftime("%Y-%m-%d"),
@@ -387,7 +445,7 @@ async def get_today_panchang(
             timezone_hours=timezone,
         )
         
-        logger.info(f"Generated Panchang for {panchang['date']}")
+        logger.info("Generated Panchang for %s", panchang['date'])
         
         return panchang
         
@@ -436,7 +494,7 @@ async def get_panchang(request: PanchangRequest):
             ayanamsha=request.ayanamsha,
         )
         
-        logger.info(f"Generated Panchang for {panchang['date']}")
+        logger.info("Generated Panchang for %s", panchang['date'])
         
         return panchang
         
@@ -497,7 +555,7 @@ async def calculate_dasha(request: DashaRequest):
             years_to_calculate=request.years_to_calculate,
         )
         
-        logger.info(f"Generated Vimsottari Dasha for {request.year}-{request.month}-{request.date}")
+        logger.info("Generated Vimsottari Dasha for %s-%s-%s", request.year, request.month, request.date)
         
         return result
         
@@ -534,7 +592,7 @@ async def calculate_dasha_from_moon(request: DashaFromMoonRequest):
             years_to_calculate=request.years_to_calculate,
         )
         
-        logger.info(f"Generated Vimsottari Dasha from Moon longitude {request.moon_longitude}")
+        logger.info("Generated Vimsottari Dasha from Moon longitude %s", request.moon_longitude)
         
         return result
         
@@ -575,7 +633,7 @@ async def calculate_match_from_moon(request: MatchingFromMoonRequest):
             groom_name=request.groom_name,
         )
         
-        logger.info(f"Generated match for {request.bride_name} & {request.groom_name}: {result['total_score']}/36")
+        logger.info("Generated match for %s & %s: %s/36", request.bride_name, request.groom_name, result['total_score'])
         
         return result
         
@@ -647,7 +705,7 @@ async def calculate_match_from_birth(request: MatchingFromBirthRequest):
         result["bride"]["birth_nakshatra_from_dasha"] = bride_dasha["birth_nakshatra"]
         result["groom"]["birth_nakshatra_from_dasha"] = groom_dasha["birth_nakshatra"]
         
-        logger.info(f"Generated match from birth details: {result['total_score']}/36")
+        logger.info("Generated match from birth details: %s/36", result['total_score'])
         
         return result
         
@@ -682,11 +740,12 @@ async def get_transits(request: TransitRequest):
     try:
         from .transits import calculate_transit_effects
         
-        result = calculate_transit_effects(
+        result = await _off(
+            calculate_transit_effects,
             natal_planets=request.natal_planets
         )
         
-        logger.info(f"Generated transit predictions: {result['summary']['total_aspects']} aspects found")
+        logger.info("Generated transit predictions: %d aspects found", result['summary']['total_aspects'])
         
         return result
         
@@ -708,7 +767,7 @@ async def get_current_positions():
     try:
         from .transits import get_current_transits
         
-        positions = get_current_transits()
+        positions = await _off(get_current_transits)
         
         return {
             "timestamp": datetime.now().isoformat(),
@@ -764,7 +823,8 @@ async def get_transits_from_birth(request: TransitFromBirthRequest):
         )
         
         # Calculate natal chart
-        natal_planets_list = calculate_planet_positions(
+        natal_planets_list = await _off(
+            calculate_planet_positions,
             dt=birth_dt,
             latitude=request.latitude,
             longitude=request.longitude,
@@ -779,7 +839,7 @@ async def get_transits_from_birth(request: TransitFromBirthRequest):
                 natal_planets[name] = lon
         
         # Calculate transits
-        result = calculate_transit_effects(natal_planets=natal_planets)
+        result = await _off(calculate_transit_effects, natal_planets=natal_planets)
         
         # Add natal data to response
         result["natal_data"] = {
@@ -787,7 +847,7 @@ async def get_transits_from_birth(request: TransitFromBirthRequest):
             "planets": natal_planets,
         }
         
-        logger.info(f"Generated transit predictions from birth chart")
+        logger.info("Generated transit predictions from birth chart")
         
         return result
         
@@ -819,12 +879,13 @@ async def detect_yogas_endpoint(request: YogasRequest):
     try:
         from .yogas import detect_yogas
         
-        result = detect_yogas(
+        result = await _off(
+            detect_yogas,
             planets_list=request.planets,
             ascendant_lon=request.ascendant_longitude
         )
         
-        logger.info(f"Detected {result['summary']['total_yogas']} yogas")
+        logger.info("Detected %d yogas", result['summary']['total_yogas'])
         return result
         
     except Exception as e:
@@ -872,7 +933,8 @@ async def detect_yogas_from_birth(request: YogasFromBirthRequest):
         )
         
         # Calculate planets (this also loads ephemeris)
-        planets_list = calculate_planet_positions(
+        planets_list = await _off(
+            calculate_planet_positions,
             dt=birth_dt,
             latitude=request.latitude,
             longitude=request.longitude,
@@ -890,7 +952,8 @@ async def detect_yogas_from_birth(request: YogasFromBirthRequest):
             ayanamsha=ayanamsha_value
         )
         
-        result = detect_yogas(
+        result = await _off(
+            detect_yogas,
             planets_list=planets_list,
             ascendant_lon=asc_lon
         )
@@ -900,7 +963,7 @@ async def detect_yogas_from_birth(request: YogasFromBirthRequest):
             "ascendant_longitude": asc_lon,
         }
         
-        logger.info(f"Detected {result['summary']['total_yogas']} yogas from birth chart")
+        logger.info("Detected %d yogas from birth chart", result['summary']['total_yogas'])
         return result
         
     except Exception as e:
@@ -923,6 +986,53 @@ class DivisionalRequest(BaseModel):
     ascendant_longitude: float = Field(
         ..., ge=0, le=360, description="Ascendant longitude"
     )
+    stream: bool = Field(False, description="Stream charts as NDJSON, one line per chart")
+
+
+# Skyfield returns numpy floats; append the NDJSON line terminator during serialization
+_NDJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+
+def _divisional_chart_stream(planets_list: List[Dict], ascendant_lon: float, extra: Optional[Dict] = None):
+    """
+    StreamingResponse of NDJSON lines: one per divisional chart, then a summary line.
+
+    Charts are computed lazily, so D1 is on the wire before D12 is calculated.
+    Input is validated here, before the 200 and headers go out, so bad
+    planet data still raises into the route's error handling.
+    """
+    from .divisional import iter_divisional_charts
+
+    charts = iter_divisional_charts(planets_list, ascendant_lon)
+    return StreamingResponse(
+        _stream_divisional_charts(charts, extra),
+        media_type="application/x-ndjson",
+    )
+
+
+def _stream_divisional_charts(charts, extra: Optional[Dict] = None):
+    """
+    Yield the NDJSON lines for an iter_divisional_charts iterator.
+
+    The status is already sent once this runs, so an error mid-stream ends
+    the body with an {"error": ...} line instead of a silent cut-off.
+    """
+    from .divisional import DIVISIONAL_CHARTS, PRIMARY_CHARTS
+
+    try:
+        for chart_key, chart in charts:
+            yield orjson.dumps({"chart": chart_key, **chart}, option=_NDJSON_OPTIONS)
+    except Exception as e:
+        logger.error(f"Error streaming divisional charts: {str(e)}", exc_info=True)
+        yield orjson.dumps({"error": f"Failed to calculate divisional charts: {str(e)}"}, option=_NDJSON_OPTIONS)
+        return
+
+    yield orjson.dumps({
+        "available_charts": list(DIVISIONAL_CHARTS),
+        "primary_charts": PRIMARY_CHARTS,
+        "backend": "internal",
+        **(extra or {}),
+    }, option=_NDJSON_OPTIONS)
 
 
 @router.post("/divisional-charts")
@@ -931,14 +1041,21 @@ async def get_divisional_charts(request: DivisionalRequest):
     try:
         from .divisional import calculate_divisional_charts
         
-        result = calculate_divisional_charts(
+        if request.stream:
+            return _divisional_chart_stream(request.planets, request.ascendant_longitude)
+        
+        result = await _off(
+            calculate_divisional_charts,
             planets_list=request.planets,
             ascendant_lon=request.ascendant_longitude
         )
         
-        logger.info(f"Calculated {len(result['available_charts'])} divisional charts")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Calculated %d divisional charts", len(result['available_charts']))
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error calculating divisional charts: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -959,6 +1076,7 @@ class DivisionalFromBirthRequest(BaseModel):
     longitude: float = Field(..., ge=-180, le=180)
     timezone: float = Field(..., ge=-12, le=14)
     chart: Optional[str] = Field(None, description="Specific chart: D1, D9, D10, etc.")
+    stream: bool = Field(False, description="Stream all charts as NDJSON, one line per chart")
 
 
 @router.post("/divisional-charts/birth-chart")
@@ -985,7 +1103,8 @@ async def get_divisional_from_birth(request: DivisionalFromBirthRequest):
         )
         
         # Calculate planets (this also loads ephemeris)
-        planets_list = calculate_planet_positions(
+        planets_list = await _off(
+            calculate_planet_positions,
             dt=birth_dt,
             latitude=request.latitude,
             longitude=request.longitude,
@@ -1003,14 +1122,22 @@ async def get_divisional_from_birth(request: DivisionalFromBirthRequest):
             ayanamsha=ayanamsha_value
         )
         
+        birth_data = {
+            "birth_date": f"{request.year}-{request.month:02d}-{request.date:02d}",
+            "ascendant_longitude": asc_lon,
+        }
+        
+        if request.stream and not request.chart:
+            return _divisional_chart_stream(planets_list, asc_lon, {"birth_data": birth_data})
+        
         # Return specific chart if requested
         if request.chart:
             if request.chart.upper() == "D9":
-                result = get_navamsa_chart(planets_list, asc_lon)
+                result = await _off(get_navamsa_chart, planets_list, asc_lon)
             elif request.chart.upper() == "D10":
-                result = get_dasamsa_chart(planets_list, asc_lon)
+                result = await _off(get_dasamsa_chart, planets_list, asc_lon)
             else:
-                all_charts = calculate_divisional_charts(planets_list, asc_lon)
+                all_charts = await _off(calculate_divisional_charts, planets_list, asc_lon)
                 chart_key = request.chart.upper()
                 if chart_key in all_charts["charts"]:
                     result = {
@@ -1020,12 +1147,9 @@ async def get_divisional_from_birth(request: DivisionalFromBirthRequest):
                 else:
                     raise ValueError(f"Chart {chart_key} not available")
         else:
-            result = calculate_divisional_charts(planets_list, asc_lon)
+            result = await _off(calculate_divisional_charts, planets_list, asc_lon)
         
-        result["birth_data"] = {
-            "birth_date": f"{request.year}-{request.month:02d}-{request.date:02d}",
-            "ascendant_longitude": asc_lon,
-        }
+        result["birth_data"] = birth_data
         
         logger.info("Calculated divisional charts from birth")
         return result
@@ -8,6 +8,8 @@ Uses planetary transits and aspects to construct meaningful predictions.
 from typing import Dict, Any, List
 import random
 
+import numpy as np
+
 # Seed for consistent daily randomness
 def _daily_random(date_str: str, salt: str) -> random.Random:
     """Create a seeded random for consistent daily variation"""
@@ -15,6 +17,18 @@ def _daily_random(date_str: str, salt: str) -> random.Random:
     return random.Random(seed)
 
 
+# Template category by (positive - negative) score, clipped to -2..+2 (index = delta + 2)
+_CATEGORY_BY_DELTA = ("challenging", "challenging", "neutral", "positive", "positive")
+
+# Overall guidance only leaves neutral on a lead of 2 or more
+_OVERALL_CATEGORY_BY_DELTA = ("challenging", "neutral", "neutral", "neutral", "positive")
+
+
+def _select_category(positive: int, negative: int, table=_CATEGORY_BY_DELTA) -> str:
+    """Look up the template category for a positive/negative score pair"""
+    return table[max(-2, min(2, positive - negative)) + 2]
+
+
 # ==============================================================================
 # OVERALL GUIDANCE
 # ==============================================================================
@@ -43,6 +57,12 @@ OVERALL_CHALLENGING = [
     "The stars urge patience and perseverance. This too shall pass.",
 ]
 
+OVERALL_TEMPLATES = {
+    "positive": OVERALL_POSITIVE,
+    "neutral": OVERALL_NEUTRAL,
+    "challenging": OVERALL_CHALLENGING,
+}
+
 
 def get_overall_guidance(transits: Dict, sign: str) -> str:
     """Generate overall daily guidance based on transits"""
@@ -51,12 +71,8 @@ def get_overall_guidance(transits: Dict, sign: str) -> str:
     positive_count = sum(1 for t in transits.values() if t.get("aspect") in ["trine", "sextile"])
     negative_count = sum(1 for t in transits.values() if t.get("aspect") in ["square", "opposition"])
     
-    if positive_count > negative_count + 1:
-        templates = OVERALL_POSITIVE
-    elif negative_count > positive_count + 1:
-        templates = OVERALL_CHALLENGING
-    else:
-        templates = OVERALL_NEUTRAL
+    category = _select_category(positive_count, negative_count, _OVERALL_CATEGORY_BY_DELTA)
+    templates = OVERALL_TEMPLATES[category]
     
     # Pick based on Sun position for daily variation
     sun_transit = transits.get("Sun", {})
@@ -109,12 +125,7 @@ def get_career_guidance(transits: Dict, sign: str) -> str:
     positive_score = sum(1 for a in [sun_aspect, saturn_aspect, jupiter_aspect] if a in positive_aspects)
     negative_score = sum(1 for a in [sun_aspect, saturn_aspect, jupiter_aspect] if a in negative_aspects)
     
-    if positive_score > negative_score:
-        category = "positive"
-    elif negative_score > positive_score:
-        category = "challenging"
-    else:
-        category = "neutral"
+    category = _select_category(positive_score, negative_score)
     
     templates = CAREER_TEMPLATES[category]
     idx = int(transits.get("Mercury", {}).get("degree", 0)) % len(templates)
@@ -176,12 +187,7 @@ def get_relationship_guidance(transits: Dict, sign: str) -> str:
     if mars_aspect in negative_aspects:
         negative_score += 1
     
-    if positive_score > negative_score:
-        category = "positive"
-    elif negative_score > positive_score:
-        category = "challenging"
-    else:
-        category = "neutral"
+    category = _select_category(positive_score, negative_score)
     
     templates = RELATIONSHIP_TEMPLATES[category]
     idx = int(transits.get("Venus", {}).get("degree", 0)) % len(templates)
@@ -243,14 +249,118 @@ def get_health_guidance(transits: Dict, sign: str) -> str:
     if saturn_aspect in negative_aspects:
         negative_score += 1  # Saturn squares/oppositions drain energy
     
-    if positive_score > negative_score:
-        category = "positive"
-    elif negative_score > positive_score:
-        category = "challenging"
-    else:
-        category = "neutral"
+    category = _select_category(positive_score, negative_score)
     
     templates = HEALTH_TEMPLATES[category]
     idx = int(transits.get("Mars", {}).get("degree", 0)) % len(templates)
     
     return templates[idx]
+
+
+# ==============================================================================
+# BATCHED GUIDANCE (ALL SIGNS AT ONCE)
+# ==============================================================================
+
+# Planet columns and aspect IDs for the stacked (signs x planets) arrays
+_GUIDANCE_PLANETS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+_PLANET_COLUMN = {name: col for col, name in enumerate(_GUIDANCE_PLANETS)}
+_ASPECT_ID = {"conjunction": 1, "sextile": 2, "square": 3, "trine": 4, "opposition": 5}
+
+POSITIVE_IDS = np.array([_ASPECT_ID["trine"], _ASPECT_ID["sextile"]], dtype=np.int8)
+NEGATIVE_IDS = np.array([_ASPECT_ID["square"], _ASPECT_ID["opposition"]], dtype=np.int8)
+_CAREER_POSITIVE_IDS = np.append(POSITIVE_IDS, np.int8(_ASPECT_ID["conjunction"]))
+
+# Category IDs: 0=positive, 1=neutral, 2=challenging
+_CATEGORIES = ("positive", "neutral", "challenging")
+
+# Category-ID versions of the delta lookup tables, for np.take
+_CATEGORY_ID_BY_DELTA = np.array([_CATEGORIES.index(c) for c in _CATEGORY_BY_DELTA], dtype=np.int64)
+_OVERALL_CATEGORY_ID_BY_DELTA = np.array(
+    [_CATEGORIES.index(c) for c in _OVERALL_CATEGORY_BY_DELTA], dtype=np.int64
+)
+
+
+def _planet_weights(**weights: int) -> np.ndarray:
+    """Weight vector over _GUIDANCE_PLANETS (unlisted planets weigh 0)"""
+    return np.array([weights.get(name, 0) for name in _GUIDANCE_PLANETS], dtype=np.int64)
+
+
+def _flatten_templates(by_category: Dict[str, List[str]]):
+    """Flatten per-category template lists into (flat tuple, offsets, lengths)"""
+    tables = [by_category[category] for category in _CATEGORIES]
+    lengths = np.array([len(table) for table in tables], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return tuple(text for table in tables for text in table), offsets, lengths
+
+
+_ALL_PLANETS = {name: 1 for name in _GUIDANCE_PLANETS}
+
+# area -> (positive IDs, positive weights, negative weights, category table, index planet, templates)
+# Mirrors the scoring of the get_*_guidance functions above.
+_GUIDANCE_RULES = {
+    "overall": (
+        POSITIVE_IDS, _planet_weights(**_ALL_PLANETS), _planet_weights(**_ALL_PLANETS),
+        _OVERALL_CATEGORY_ID_BY_DELTA, "Sun", _flatten_templates(OVERALL_TEMPLATES),
+    ),
+    "career": (
+        _CAREER_POSITIVE_IDS,
+        _planet_weights(Sun=1, Saturn=1, Jupiter=1),
+        _planet_weights(Sun=1, Saturn=1, Jupiter=1),
+        _CATEGORY_ID_BY_DELTA, "Mercury", _flatten_templates(CAREER_TEMPLATES),
+    ),
+    "relationships": (
+        POSITIVE_IDS,
+        _planet_weights(Venus=2, Moon=1),
+        _planet_weights(Venus=2, Moon=1, Mars=1),
+        _CATEGORY_ID_BY_DELTA, "Venus", _flatten_templates(RELATIONSHIP_TEMPLATES),
+    ),
+    "health": (
+        POSITIVE_IDS,
+        _planet_weights(Mars=1, Sun=1),
+        _planet_weights(Mars=1, Sun=1, Saturn=1),
+        _CATEGORY_ID_BY_DELTA, "Mars", _flatten_templates(HEALTH_TEMPLATES),
+    ),
+}
+
+
+def get_all_guidance(transits_by_sign: Dict[str, Dict]) -> Dict[str, Dict[str, str]]:
+    """
+    Generate guidance for many signs in one vectorized pass.
+
+    Produces the same texts as calling the four get_*_guidance functions per
+    sign, but scores all signs at once on stacked (signs x planets) arrays.
+
+    Args:
+        transits_by_sign: Sign -> transit aspects (as passed to get_*_guidance)
+
+    Returns:
+        Sign -> {"overall", "career", "relationships", "health"} guidance
+    """
+    signs = list(transits_by_sign)
+    aspect_ids = np.zeros((len(signs), len(_GUIDANCE_PLANETS)), dtype=np.int8)
+    # float64 like the per-sign int(degree): float32 would round 29.9999999 up to 30
+    degrees = np.zeros((len(signs), len(_GUIDANCE_PLANETS)), dtype=np.float64)
+
+    for row, transits in enumerate(transits_by_sign.values()):
+        for planet_name, transit in transits.items():
+            col = _PLANET_COLUMN.get(planet_name)
+            if col is None:
+                continue
+            aspect_ids[row, col] = _ASPECT_ID.get(transit.get("aspect"), 0)
+            degrees[row, col] = transit.get("degree", 0)
+
+    is_negative = np.isin(aspect_ids, NEGATIVE_IDS)
+    guidance = {sign: {} for sign in signs}
+
+    for area, (positive_ids, pos_weights, neg_weights, category_table, index_planet, templates) in _GUIDANCE_RULES.items():
+        flat, offsets, lengths = templates
+        positive = np.isin(aspect_ids, positive_ids) @ pos_weights
+        negative = is_negative @ neg_weights
+        categories = np.take(category_table, np.clip(positive - negative, -2, 2) + 2)
+
+        # Pick based on the index planet's degree for daily variation
+        idx = degrees[:, _PLANET_COLUMN[index_planet]].astype(np.int64) % lengths[categories]
+        for sign, flat_idx in zip(signs, (offsets[categories] + idx).tolist()):
+            guidance[sign][area] = flat[flat_idx]
+
+    return guidance
@@ -5,9 +5,18 @@ Calculates the effects of current planetary transits on a natal birth chart.
 Analyzes aspects between transiting planets and natal planet positions.
 """
 
-from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+import functools
 import logging
+import operator
+
+import numpy as np
+
+from . import planetary
+from .houses import datetime_to_julian_date
+from .jit import njit, NUMBA_AVAILABLE
+from .planetary import _ensure_ephemeris, _utc_jd_time, calculate_lahiri_ayanamsha
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +31,15 @@ ASPECTS = {
 
 # Planet significations for interpretation
 PLANET_SIGNIFICATIONS = {
-    "Sun": ["self", "vitality", "authority", "career", "father"],
-    "Moon": ["mind", "emotions", "mother", "public", "comfort"],
-    "Mars": ["energy", "action", "courage", "conflict", "siblings"],
-    "Mercury": ["communication", "intellect", "business", "education"],
-    "Jupiter": ["wisdom", "luck", "expansion", "spirituality", "guru"],
-    "Venus": ["love", "beauty", "wealth", "arts", "relationships"],
-    "Saturn": ["discipline", "karma", "delays", "structure", "lessons"],
-    "Rahu": ["desires", "obsession", "unconventional", "foreign"],
-    "Ketu": ["spirituality", "detachment", "past karma", "liberation"],
+    "Sun": ("self", "vitality", "authority", "career", "father"),
+    "Moon": ("mind", "emotions", "mother", "public", "comfort"),
+    "Mars": ("energy", "action", "courage", "conflict", "siblings"),
+    "Mercury": ("communication", "intellect", "business", "education"),
+    "Jupiter": ("wisdom", "luck", "expansion", "spirituality", "guru"),
+    "Venus": ("love", "beauty", "wealth", "arts", "relationships"),
+    "Saturn": ("discipline", "karma", "delays", "structure", "lessons"),
+    "Rahu": ("desires", "obsession", "unconventional", "foreign"),
+    "Ketu": ("spirituality", "detachment", "past karma", "liberation"),
 }
 
 # Transit effects based on nature
@@ -70,105 +79,241 @@ TRANSIT_EFFECTS = {
     },
 }
 
+# Flattened (planet, nature) -> effect lookup
+_EFFECT_FLAT = {
+    (planet, nature): effect
+    for nature, effects in TRANSIT_EFFECTS.items()
+    for planet, effect in effects.items()
+}
+
+# Significance by (is_slow_planet, exactness > 0.8)
+_SIG_TABLE = {
+    (False, False): "minor",
+    (False, True): "notable",
+    (True, False): "major",
+    (True, True): "critical",
+}
+
+# Sort rank per significance (most significant first)
+_PRIO = {"critical": 0, "major": 1, "notable": 2, "minor": 3}
+
 # Transiting planets to consider
-TRANSIT_PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+TRANSIT_PLANETS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
 
 # Slow planets (their transits are more significant)
-SLOW_PLANETS = ["Jupiter", "Saturn", "Rahu", "Ketu"]
+SLOW_PLANETS = frozenset({"Jupiter", "Saturn", "Rahu", "Ketu"})
 
+# Aspect IDs used by the classification kernel (0 = no aspect)
+ASPECT_IDS = ("conjunction", "sextile", "square", "trine", "opposition")
 
-def calculate_aspect(transit_lon: float, natal_lon: float) -> Dict[str, Any]:
-    """Check if there's an aspect between transit and natal position."""
-    diff = abs(transit_lon - natal_lon)
+# (target_angle, orb) per aspect ID - 1
+_ORB_TABLE = np.array(
+    [(ASPECTS[name]["angle"], ASPECTS[name]["orb"]) for name in ASPECT_IDS],
+    dtype=np.float64,
+)
+
+
+# Same table split into columns for broadcasting
+_ASPECT_ANGLES = _ORB_TABLE[:, 0]
+_ASPECT_ORBS = _ORB_TABLE[:, 1]
+
+# Whole-degree buckets of the separation (0-180) that overlap some aspect's
+# orb; pairs in any other bucket are rejected with one lookup
+_CANDIDATE_BY_DEGREE = np.array(
+    [
+        any(angle - orb < degree + 1 and degree <= angle + orb for angle, orb in _ORB_TABLE.tolist())
+        for degree in range(181)
+    ],
+    dtype=np.bool_,
+)
+
+
+def _separation_matrix(transit_lons: np.ndarray, natal_lons: np.ndarray) -> np.ndarray:
+    """Shortest angular distance (0-180) between every transit/natal pair."""
+    diff = np.abs(transit_lons[:, None] - natal_lons[None, :]) % 360.0
+    return np.where(diff > 180.0, 360.0 - diff, diff)
+
+
+def _classify_aspects_vectorized(
+    transit_lons: np.ndarray,
+    natal_lons: np.ndarray,
+    orb_table: np.ndarray,
+    candidates: np.ndarray,
+) -> np.ndarray:
+    """
+    NumPy broadcast version of `_classify_aspects_jit`, used when Numba is
+    not installed. Same inputs and output.
+    """
+    diff = _separation_matrix(transit_lons, natal_lons)
+    aspect_ids = np.zeros(diff.shape, dtype=np.int8)
+    
+    # Only pairs in a candidate bucket are checked against each orb
+    # (NaN separations go to bucket 0 and then fail every orb check)
+    mask = candidates[np.nan_to_num(diff).astype(np.intp)]
+    hit = np.abs(diff[mask][:, None] - orb_table[:, 0]) <= orb_table[:, 1]
+    aspect_ids[mask] = np.where(hit.any(axis=-1), hit.argmax(axis=-1) + 1, 0)
+    return aspect_ids
+
+
+@njit(
+    "int8[:, :](float64[:], float64[:], float64[:, :], boolean[:])",
+    cache=True, nogil=True, error_model='numpy',
+)
+def _classify_aspects_jit(
+    transit_lons: np.ndarray,
+    natal_lons: np.ndarray,
+    orb_table: np.ndarray,
+    candidates: np.ndarray,
+) -> np.ndarray:
+    """
+    Classify the aspect between every transit/natal longitude pair.
+
+    `candidates` is the per-degree prefilter (_CANDIDATE_BY_DEGREE).
+    Returns an int8 matrix of shape (len(transit_lons), len(natal_lons)) with
+    aspect IDs: 0=none, 1=conjunction, 2=sextile, 3=square, 4=trine, 5=opposition.
+    """
+    n_transit = transit_lons.shape[0]
+    n_natal = natal_lons.shape[0]
+    aspect_ids = np.zeros((n_transit, n_natal), dtype=np.int8)
+
+    for i in range(n_transit):
+        for j in range(n_natal):
+            diff = abs(transit_lons[i] - natal_lons[j]) % 360.0
+            if diff > 180.0:
+                diff = 360.0 - diff
+
+            # One table lookup rejects most pairs before the orb checks
+            if np.isnan(diff) or not candidates[int(diff)]:
+                continue
+
+            for k in range(orb_table.shape[0]):
+                if abs(diff - orb_table[k, 0]) <= orb_table[k, 1]:
+                    aspect_ids[i, j] = k + 1
+                    break
+
+    return aspect_ids
+
+
+_classify_aspects = _classify_aspects_jit if NUMBA_AVAILABLE else _classify_aspects_vectorized
+
+
+def _angular_separation(transit_lon: float, natal_lon: float) -> float:
+    """Shortest angular distance (0-180) between two longitudes."""
+    diff = abs(transit_lon - natal_lon) % 360
     if diff > 180:
         diff = 360 - diff
+    return diff
+
+
+def _aspect_details(aspect_name: str, diff: float) -> Dict[str, Any]:
+    """Build the aspect description for a separation known to be within orb."""
+    aspect_data = ASPECTS[aspect_name]
+    angle = aspect_data["angle"]
+    orb = aspect_data["orb"]
+    exactness = 1 - (abs(diff - angle) / orb)
+    return {
+        "aspect": aspect_name,
+        "angle": angle,
+        "actual_angle": round(diff, 2),
+        "orb": round(abs(diff - angle), 2),
+        "exactness": round(exactness, 2),
+        "nature": aspect_data["nature"],
+    }
+
+
+def calculate_aspect(transit_lon: float, natal_lon: float) -> Dict[str, Any]:
+    """Check if there's an aspect between transit and natal position."""
+    diff = _angular_separation(transit_lon, natal_lon)
     
     for aspect_name, aspect_data in ASPECTS.items():
-        angle = aspect_data["angle"]
-        orb = aspect_data["orb"]
-        
-        if abs(diff - angle) <= orb:
-            exactness = 1 - (abs(diff - angle) / orb)
-            return {
-                "aspect": aspect_name,
-                "angle": angle,
-                "actual_angle": round(diff, 2),
-                "orb": round(abs(diff - angle), 2),
-                "exactness": round(exactness, 2),
-                "nature": aspect_data["nature"],
-            }
+        if abs(diff - aspect_data["angle"]) <= aspect_data["orb"]:
+            return _aspect_details(aspect_name, diff)
     
     return None
 
 
-def get_current_transits(timezone_hours: float = 5.5) -> Dict[str, float]:
+def get_current_transits(
+    timezone_hours: float = 5.5,
+    now: Optional[datetime] = None,
+) -> Dict[str, float]:
     """
     Get current planetary positions for transit calculation.
     Uses the planetary module for real-time positions.
+    
+    `now` overrides the current time (UTC), so callers can report the same
+    instant the positions were computed for.
+    
+    Positions are cached per minute of time (see `_compute_transits_at_jd`),
+    so concurrent and repeated requests share one ephemeris calculation.
     """
     try:
-        from .planetary import (
-            _ensure_ephemeris,
-            calculate_lahiri_ayanamsha,
-        )
-        from .houses import datetime_to_julian_date
-        
-        _ensure_ephemeris()
-        
-        from . import planetary
-        ts = planetary._ts
-        eph = planetary._eph
-        
-        # Get current time
-        now = datetime.now(timezone.utc)
-        t = ts.utc(now)
-        
-        earth = eph['earth']
-        
-        # Calculate ayanamsha
+        # Round to the minute so nearby requests hit the same cache entry
+        if now is None:
+            now = datetime.now(timezone.utc)
         jd = datetime_to_julian_date(now)
-        ayanamsha = calculate_lahiri_ayanamsha(jd)
-        
-        transits = {}
-        
-        # True planets
-        planet_keys = {
-            "Sun": "sun",
-            "Moon": "moon", 
-            "Mars": "mars",
-            "Mercury": "mercury",
-            "Jupiter": "jupiter barycenter",
-            "Venus": "venus",
-            "Saturn": "saturn barycenter",
-        }
+        jd_rounded = round(jd * 1440) / 1440.0
         
-        for planet_name, eph_key in planet_keys.items():
-            planet = eph[eph_key]
-            astrometric = earth.at(t).observe(planet)
-            ecliptic = astrometric.apparent().ecliptic_latlon()
-            tropical_lon = ecliptic[1].degrees
-            sidereal_lon = (tropical_lon - ayanamsha) % 360
-            transits[planet_name] = round(sidereal_lon, 4)
-        
-        # Calculate mean Rahu (North Node)
-        # Rahu/Ketu move retrograde, roughly 19.3° per year
-        # Using a reference point and calculating
-        # Reference: Rahu was at ~0° Aries on Jan 1, 2000
-        days_since_2000 = (now - datetime(2000, 1, 1, tzinfo=timezone.utc)).days
-        rahu_movement = (days_since_2000 / 365.25) * 19.3
-        rahu_lon = (0 - rahu_movement) % 360  # Retrograde
-        ketu_lon = (rahu_lon + 180) % 360
-        
-        transits["Rahu"] = round(rahu_lon, 4)
-        transits["Ketu"] = round(ketu_lon, 4)
-        
-        return transits
+        return dict(_compute_transits_at_jd(jd_rounded))
         
     except Exception as e:
         logger.error(f"Error getting current transits: {e}", exc_info=True)
         raise
 
 
+@functools.lru_cache(maxsize=2048)
+def _compute_transits_at_jd(jd_rounded: float) -> Tuple[Tuple[str, float], ...]:
+    """
+    Sidereal transit longitudes at a Julian Date (UTC).
+    
+    Process-wide LRU cache: entries are immutable (name, longitude) pairs
+    and are only discarded by eviction or a process restart.
+    """
+    _ensure_ephemeris()
+    
+    # Read through the module: set by the lazy load
+    eph = planetary._eph
+    
+    t = _utc_jd_time(jd_rounded)
+    
+    earth = eph['earth']
+    
+    # Calculate ayanamsha
+    ayanamsha = calculate_lahiri_ayanamsha(jd_rounded)
+    
+    # True planets
+    planet_keys = {
+        "Sun": "sun",
+        "Moon": "moon", 
+        "Mars": "mars",
+        "Mercury": "mercury",
+        "Jupiter": "jupiter barycenter",
+        "Venus": "venus",
+        "Saturn": "saturn barycenter",
+    }
+    
+    # Observe every body from one Earth position at this instant
+    earth_at_t = earth.at(t)
+    tropical_lons = np.array([
+        earth_at_t.observe(eph[eph_key]).apparent().ecliptic_latlon()[1].degrees
+        for eph_key in planet_keys.values()
+    ])
+    sidereal_lons = np.round((tropical_lons - ayanamsha) % 360, 4)
+    
+    transits = dict(zip(planet_keys, sidereal_lons.tolist()))
+    
+    # Calculate mean Rahu (North Node)
+    # Rahu/Ketu move retrograde, roughly 19.3° per year
+    # Using a reference point and calculating
+    # Reference: Rahu was at ~0° Aries on Jan 1, 2000 (JD 2451544.5)
+    days_since_2000 = jd_rounded - 2451544.5
+    rahu_lon = (-days_since_2000 / 365.25 * 19.3) % 360  # Retrograde
+    nodes = np.round(np.array([rahu_lon, rahu_lon + 180.0]) % 360, 4)
+    
+    transits["Rahu"], transits["Ketu"] = nodes.tolist()
+    
+    return tuple(transits.items())
+
+
 def calculate_transit_effects(
     natal_planets: Dict[str, float],
     transit_time: datetime = None
@@ -184,44 +329,64 @@ def calculate_transit_effects(
         Transit analysis with aspects and interpretations
     """
     try:
+        # One timestamp for both the positions and the reported time
+        now = transit_time or datetime.now(timezone.utc)
+        
         # Get current transits
-        current_transits = get_current_transits()
+        current_transits = get_current_transits(now=now)
+        
+        # Classify every transit/natal pair in one pass
+        transit_names = list(current_transits)
+        natal_names = list(natal_planets)
+        transit_lons = np.fromiter(current_transits.values(), dtype=np.float64, count=len(transit_names))
+        natal_lons = np.fromiter(natal_planets.values(), dtype=np.float64, count=len(natal_names))
+        aspect_ids = _classify_aspects(transit_lons, natal_lons, _ORB_TABLE, _CANDIDATE_BY_DEGREE)
         
-        # Analyze each transit planet against each natal planet
+        # Orb and exactness for the sparse hits only
+        hit_t, hit_n = np.nonzero(aspect_ids)
+        hit_idx = aspect_ids[hit_t, hit_n].astype(np.intp) - 1
+        orb_off = np.abs(_separation_matrix(transit_lons, natal_lons)[hit_t, hit_n] - _ASPECT_ANGLES[hit_idx])
+        exactness = 1 - orb_off / _ASPECT_ORBS[hit_idx]
+        
+        # Build interpretations for the pairs that form an aspect
         active_transits = []
         
-        for transit_planet, transit_lon in current_transits.items():
-            for natal_planet, natal_lon in natal_planets.items():
-                aspect_data = calculate_aspect(transit_lon, natal_lon)
-                
-                if aspect_data:
-                    # Get interpretation
-                    nature = aspect_data["nature"]
-                    effect = TRANSIT_EFFECTS.get(nature, {}).get(transit_planet, "Significant transit")
-                    
-                    # Determine significance
-                    is_slow = transit_planet in SLOW_PLANETS
-                    significance = "major" if is_slow else "minor"
-                    if aspect_data["exactness"] > 0.8:
-                        significance = "critical" if is_slow else "notable"
-                    
-                    active_transits.append({
-                        "transit_planet": transit_planet,
-                        "transit_longitude": transit_lon,
-                        "natal_planet": natal_planet,
-                        "natal_longitude": natal_lon,
-                        "aspect": aspect_data["aspect"],
-                        "nature": nature,
-                        "exactness": aspect_data["exactness"],
-                        "orb": aspect_data["orb"],
-                        "effect": effect,
-                        "significance": significance,
-                        "significations": PLANET_SIGNIFICATIONS.get(transit_planet, []),
-                    })
+        for i, j, k, orb, exact in zip(
+            hit_t.tolist(), hit_n.tolist(), hit_idx.tolist(), orb_off.tolist(), exactness.tolist()
+        ):
+            transit_planet = transit_names[i]
+            transit_lon = current_transits[transit_planet]
+            natal_planet = natal_names[j]
+            natal_lon = natal_planets[natal_planet]
+            aspect_name = ASPECT_IDS[k]
+            exactness_rounded = round(exact, 2)
+            
+            # Get interpretation
+            nature = ASPECTS[aspect_name]["nature"]
+            effect = _EFFECT_FLAT.get((transit_planet, nature), "Significant transit")
+            
+            # Determine significance
+            significance = _SIG_TABLE[(transit_planet in SLOW_PLANETS, exactness_rounded > 0.8)]
+            
+            active_transits.append({
+                "transit_planet": transit_planet,
+                "transit_longitude": transit_lon,
+                "natal_planet": natal_planet,
+                "natal_longitude": natal_lon,
+                "aspect": aspect_name,
+                "nature": nature,
+                "exactness": exactness_rounded,
+                "orb": round(orb, 2),
+                "effect": effect,
+                "significance": significance,
+                "significations": PLANET_SIGNIFICATIONS[transit_planet],
+                "_sort_key": (_PRIO[significance], -exactness_rounded),
+            })
         
-        # Sort by significance and exactness
-        priority_order = {"critical": 0, "major": 1, "notable": 2, "minor": 3}
-        active_transits.sort(key=lambda x: (priority_order.get(x["significance"], 4), -x["exactness"]))
+        # Sort by significance and exactness, then drop the internal key
+        active_transits.sort(key=operator.itemgetter("_sort_key"))
+        for transit in active_transits:
+            del transit["_sort_key"]
         
         # Generate summary
         major_transits = [t for t in active_transits if t["significance"] in ["critical", "major"]]
@@ -239,7 +404,7 @@ def calculate_transit_effects(
             summary = "Current transits bring a mix of opportunities and challenges."
         
         return {
-            "transit_time": datetime.now(timezone.utc).isoformat(),
+            "transit_time": now.isoformat(),
             "current_positions": current_transits,
             "active_transits": active_transits,
             "summary": {
@@ -5,9 +5,21 @@ Identifies special planetary combinations in a birth chart that indicate
 specific life effects according to Vedic astrology.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import functools
 import logging
 
+import numpy as np
+
+from .yogas_kernels import (
+    PLANET_NAMES,
+    PLANET_IDX,
+    N_PLANETS,
+    _raj_yoga_pairs,
+    _mahapurusha_hits,
+    _neecha_bhanga_pairs,
+)
+
 logger = logging.getLogger(__name__)
 
 # Rashi lords mapping
@@ -30,17 +42,61 @@ DEBILITATION = {
 }
 
 # Kendra houses (angular)
-KENDRAS = [1, 4, 7, 10]
+KENDRAS = frozenset({1, 4, 7, 10})
 
 # Trikona houses (trinal)
-TRIKONAS = [1, 5, 9]
+TRIKONAS = (1, 5, 9)
 
 # Dusthanas (malefic houses)
-DUSTHANAS = [6, 8, 12]
+DUSTHANAS = (6, 8, 12)
 
 # Natural benefics and malefics
-BENEFICS = ["Jupiter", "Venus", "Moon", "Mercury"]
-MALEFICS = ["Sun", "Mars", "Saturn", "Rahu", "Ketu"]
+BENEFICS = frozenset({"Jupiter", "Venus", "Moon", "Mercury"})
+MALEFICS = ("Sun", "Mars", "Saturn", "Rahu", "Ketu")
+
+# Pancha Mahapurusha yoga per planet: (yoga name, effect)
+MAHAPURUSHA = {
+    "Mars": ("Ruchaka", "Courage, leadership, authority in military/police"),
+    "Mercury": ("Bhadra", "Intelligence, eloquence, business acumen"),
+    "Jupiter": ("Hamsa", "Wisdom, spirituality, teaching ability"),
+    "Venus": ("Malavya", "Beauty, luxury, artistic talents, pleasures"),
+    "Saturn": ("Shasha", "Power through discipline, longevity, success through hard work")
+}
+
+# Lord of each house by ascendant rashi: _HOUSE_LORD[asc_rashi - 1][house - 1]
+_HOUSE_LORD = tuple(
+    tuple(RASHI_LORDS[((asc + house) % 12) + 1] for house in range(12))
+    for asc in range(12)
+)
+
+# Signs ruled by each planet
+_OWN_SIGNS = {
+    planet: frozenset(rashi for rashi, lord in RASHI_LORDS.items() if lord == planet)
+    for planet in set(RASHI_LORDS.values())
+}
+
+# Index-encoded tables for the kernels in yogas_kernels.py
+# (rashi / house numbers index directly; 0 = none)
+_HOUSE_LORD_IDX = np.array(
+    [[PLANET_IDX[lord] for lord in row] for row in _HOUSE_LORD], dtype=np.int8
+)
+_RASHI_LORD_IDX = np.array(
+    [0] + [PLANET_IDX[RASHI_LORDS[r]] for r in range(1, 13)], dtype=np.int8
+)
+_DEBILITATION_IDX = np.array([DEBILITATION.get(name, 0) for name in PLANET_NAMES], dtype=np.int8)
+_KENDRA_HOUSES = np.array(sorted(KENDRAS), dtype=np.int8)
+_TRIKONA_HOUSES = np.array(TRIKONAS, dtype=np.int8)
+_KENDRA_MASK = np.isin(np.arange(13), sorted(KENDRAS))
+_MAHAPURUSHA_IDX = np.array([PLANET_IDX[name] for name in MAHAPURUSHA], dtype=np.int8)
+
+# _MAHAPURUSHA_QUALIFIES[planet_idx, rashi]: own sign or exaltation sign
+_MAHAPURUSHA_QUALIFIES = np.array(
+    [
+        [rashi in _OWN_SIGNS.get(name, ()) or rashi == EXALTATION.get(name) for rashi in range(13)]
+        for name in PLANET_NAMES
+    ],
+    dtype=np.bool_,
+)
 
 
 def get_rashi_from_lon(longitude: float) -> int:
@@ -64,48 +120,51 @@ def is_debilitated(planet: str, rashi: int) -> bool:
     return DEBILITATION.get(planet) == rashi
 
 
-def detect_raj_yogas(planets: Dict[str, Dict], asc_rashi: int) -> List[Dict]:
+def _planet_arrays(planets: Dict[str, Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode a planets dict as (rashi, house) int8 arrays indexed by PLANET_IDX.
+    
+    Planets that are missing, unknown, or outside 0-360° are left as 0.
+    """
+    rashi_arr = np.zeros(N_PLANETS, dtype=np.int8)
+    house_arr = np.zeros(N_PLANETS, dtype=np.int8)
+    
+    for name, p_data in planets.items():
+        idx = PLANET_IDX.get(name)
+        rashi = p_data.get("rashi", 0)
+        if idx is None or not 1 <= rashi <= 12:
+            continue
+        rashi_arr[idx] = rashi
+        house_arr[idx] = p_data.get("house", 0)
+    
+    return rashi_arr, house_arr
+
+
+def detect_raj_yogas(
+    planets: Dict[str, Dict],
+    asc_rashi: int,
+    arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> List[Dict]:
     """Detect Raja Yogas (combinations for power and authority)."""
-    yogas = []
+    rashi_arr, _ = arrays if arrays is not None else _planet_arrays(planets)
+    
+    # Raja Yoga: Kendra lord + Trikona lord conjunction
+    pairs = _raj_yoga_pairs(
+        rashi_arr, _HOUSE_LORD_IDX[(asc_rashi - 1) % 12], _KENDRA_HOUSES, _TRIKONA_HOUSES
+    )
     
-    # Get lords of kendras and trikonas
-    kendra_lords = set()
-    trikona_lords = set()
-    
-    for house in KENDRAS:
-        rashi = ((asc_rashi - 1 + house - 1) % 12) + 1
-        lord = RASHI_LORDS[rashi]
-        kendra_lords.add(lord)
-    
-    for house in TRIKONAS:
-        rashi = ((asc_rashi - 1 + house - 1) % 12) + 1
-        lord = RASHI_LORDS[rashi]
-        trikona_lords.add(lord)
-    
-    # Raja Yoga: Kendra lord + Trikona lord conjunction or mutual aspect
-    for kl in kendra_lords:
-        for tl in trikona_lords:
-            if kl == tl:
-                continue
-            kl_data = planets.get(kl, {})
-            tl_data = planets.get(tl, {})
-            
-            if not kl_data or not tl_data:
-                continue
-            
-            kl_rashi = kl_data.get("rashi", 0)
-            tl_rashi = tl_data.get("rashi", 0)
-            
-            # Check conjunction (same sign)
-            if kl_rashi == tl_rashi:
-                yogas.append({
-                    "name": f"Raja Yoga ({kl}-{tl})",
-                    "type": "raja",
-                    "planets": [kl, tl],
-                    "description": f"Kendra lord {kl} conjunct Trikona lord {tl}",
-                    "effect": "Rise in status, power, authority, and recognition",
-                    "strength": "strong"
-                })
+    yogas = []
+    for kl_idx, tl_idx in pairs.tolist():
+        kl = PLANET_NAMES[kl_idx]
+        tl = PLANET_NAMES[tl_idx]
+        yogas.append({
+            "name": f"Raja Yoga ({kl}-{tl})",
+            "type": "raja",
+            "planets": [kl, tl],
+            "description": f"Kendra lord {kl} conjunct Trikona lord {tl}",
+            "effect": "Rise in status, power, authority, and recognition",
+            "strength": "strong"
+        })
     
     return yogas
 
@@ -115,11 +174,9 @@ def detect_dhana_yogas(planets: Dict[str, Dict], asc_rashi: int) -> List[Dict]:
     yogas = []
     
     # 2nd and 11th house lords for wealth
-    second_rashi = ((asc_rashi - 1 + 1) % 12) + 1
-    eleventh_rashi = ((asc_rashi - 1 + 10) % 12) + 1
-    
-    second_lord = RASHI_LORDS[second_rashi]
-    eleventh_lord = RASHI_LORDS[eleventh_rashi]
+    house_lords = _HOUSE_LORD[(asc_rashi - 1) % 12]
+    second_lord = house_lords[1]
+    eleventh_lord = house_lords[10]
     
     # Check if 2nd and 11th lords are together or in kendras
     sl_data = planets.get(second_lord, {})
@@ -152,7 +209,7 @@ def detect_dhana_yogas(planets: Dict[str, Dict], asc_rashi: int) -> List[Dict]:
     jupiter_data = planets.get("Jupiter", {})
     if jupiter_data:
         jup_house = jupiter_data.get("house", 0)
-        if jup_house in [2, 5, 9, 11]:
+        if jup_house in {2, 5, 9, 11}:
             yogas.append({
                 "name": "Jupiter Wealth Yoga",
                 "type": "dhana",
@@ -178,12 +235,8 @@ def detect_gaja_kesari(planets: Dict[str, Dict]) -> List[Dict]:
     moon_rashi = moon_data.get("rashi", 0)
     jup_rashi = jupiter_data.get("rashi", 0)
     
-    # Check if Moon and Jupiter are in kendra from each other (1, 4, 7, 10)
-    diff = abs(moon_rashi - jup_rashi)
-    if diff == 0:
-        diff = 1
-    else:
-        diff = ((jup_rashi - moon_rashi) % 12) + 1
+    # Check if Jupiter is in kendra from the Moon (1, 4, 7, 10)
+    diff = ((jup_rashi - moon_rashi) % 12) + 1
     
     if diff in [1, 4, 7, 10]:
         yogas.append({
@@ -198,76 +251,94 @@ def detect_gaja_kesari(planets: Dict[str, Dict]) -> List[Dict]:
     return yogas
 
 
-def detect_pancha_mahapurusha(planets: Dict[str, Dict], asc_rashi: int) -> List[Dict]:
+def detect_pancha_mahapurusha(
+    planets: Dict[str, Dict],
+    asc_rashi: int,
+    arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> List[Dict]:
     """Detect Pancha Mahapurusha Yogas (5 great person yogas)."""
-    yogas = []
+    rashi_arr, house_arr = arrays if arrays is not None else _planet_arrays(planets)
     
-    mahapurusha = {
-        "Mars": ("Ruchaka", "Courage, leadership, authority in military/police"),
-        "Mercury": ("Bhadra", "Intelligence, eloquence, business acumen"),
-        "Jupiter": ("Hamsa", "Wisdom, spirituality, teaching ability"),
-        "Venus": ("Malavya", "Beauty, luxury, artistic talents, pleasures"),
-        "Saturn": ("Shasha", "Power through discipline, longevity, success through hard work")
-    }
+    # Must be in kendra and in own sign or exaltation
+    hits = _mahapurusha_hits(
+        rashi_arr, house_arr, _MAHAPURUSHA_IDX, _MAHAPURUSHA_QUALIFIES, _KENDRA_MASK
+    )
     
-    for planet, (yoga_name, effect) in mahapurusha.items():
-        p_data = planets.get(planet, {})
-        if not p_data:
-            continue
-        
-        p_house = p_data.get("house", 0)
-        p_rashi = p_data.get("rashi", 0)
-        own_signs = [i for i, lord in RASHI_LORDS.items() if lord == planet]
-        exalt_sign = EXALTATION.get(planet)
-        
-        # Must be in kendra and in own sign or exaltation
-        if p_house in KENDRAS:
-            if p_rashi in own_signs or p_rashi == exalt_sign:
-                yogas.append({
-                    "name": f"{yoga_name} Yoga",
-                    "type": "mahapurusha",
-                    "planets": [planet],
-                    "description": f"{planet} in kendra in own sign/exaltation",
-                    "effect": effect,
-                    "strength": "very strong"
-                })
+    yogas = []
+    for (planet, (yoga_name, effect)), hit in zip(MAHAPURUSHA.items(), hits.tolist()):
+        if hit:
+            yogas.append({
+                "name": f"{yoga_name} Yoga",
+                "type": "mahapurusha",
+                "planets": [planet],
+                "description": f"{planet} in kendra in own sign/exaltation",
+                "effect": effect,
+                "strength": "very strong"
+            })
     
     return yogas
 
 
-def detect_neecha_bhanga(planets: Dict[str, Dict]) -> List[Dict]:
+def detect_neecha_bhanga(
+    planets: Dict[str, Dict],
+    arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> List[Dict]:
     """Detect Neecha Bhanga Raja Yoga (cancellation of debilitation)."""
-    yogas = []
+    rashi_arr, house_arr = arrays if arrays is not None else _planet_arrays(planets)
     
-    for planet_name, p_data in planets.items():
-        if planet_name in ["Rahu", "Ketu"]:
-            continue
-        
-        p_rashi = p_data.get("rashi", 0)
-        
-        # Check if debilitated
-        if not is_debilitated(planet_name, p_rashi):
-            continue
-        
-        # Cancellation: Lord of debilitation sign in kendra from Moon or Ascendant
-        debil_lord = RASHI_LORDS.get(p_rashi)
-        if debil_lord:
-            lord_data = planets.get(debil_lord, {})
-            if lord_data:
-                lord_house = lord_data.get("house", 0)
-                if lord_house in KENDRAS:
-                    yogas.append({
-                        "name": "Neecha Bhanga Raja Yoga",
-                        "type": "raja",
-                        "planets": [planet_name, debil_lord],
-                        "description": f"{planet_name}'s debilitation cancelled by {debil_lord} in kendra",
-                        "effect": "Tremendous rise after initial struggles, turning weakness to strength",
-                        "strength": "strong"
-                    })
+    # Cancellation: Lord of debilitation sign in kendra from Ascendant
+    pairs = _neecha_bhanga_pairs(
+        rashi_arr, house_arr, _RASHI_LORD_IDX, _DEBILITATION_IDX, _KENDRA_MASK
+    )
+    
+    yogas = []
+    for planet_idx, lord_idx in pairs.tolist():
+        planet_name = PLANET_NAMES[planet_idx]
+        debil_lord = PLANET_NAMES[lord_idx]
+        yogas.append({
+            "name": "Neecha Bhanga Raja Yoga",
+            "type": "raja",
+            "planets": [planet_name, debil_lord],
+            "description": f"{planet_name}'s debilitation cancelled by {debil_lord} in kendra",
+            "effect": "Tremendous rise after initial struggles, turning weakness to strength",
+            "strength": "strong"
+        })
     
     return yogas
 
 
+@functools.lru_cache(maxsize=1024)
+def _detect_yogas_cached(chart_key: Tuple[Tuple[str, int, int], ...], asc_rashi: int) -> Tuple[Dict, ...]:
+    """
+    Run all yoga detectors for a chart given as sorted (name, rashi, house)
+    tuples. Results are shared between callers: detect_yogas hands out copies.
+    """
+    planets = {name: {"rashi": rashi, "house": house} for name, rashi, house in chart_key}
+    
+    # Encode once for the array kernels
+    arrays = _planet_arrays(planets)
+    
+    # Collect all yogas
+    all_yogas = []
+    
+    # Pancha Mahapurusha (most powerful)
+    all_yogas.extend(detect_pancha_mahapurusha(planets, asc_rashi, arrays))
+    
+    # Raja Yogas
+    all_yogas.extend(detect_raj_yogas(planets, asc_rashi, arrays))
+    
+    # Gaja Kesari
+    all_yogas.extend(detect_gaja_kesari(planets))
+    
+    # Dhana Yogas
+    all_yogas.extend(detect_dhana_yogas(planets, asc_rashi))
+    
+    # Neecha Bhanga
+    all_yogas.extend(detect_neecha_bhanga(planets, arrays))
+    
+    return tuple(all_yogas)
+
+
 def detect_yogas(planets_list: List[Dict], ascendant_lon: float) -> Dict[str, Any]:
     """
     Detect all yogas in a birth chart.
@@ -277,22 +348,32 @@ def detect_yogas(planets_list: List[Dict], ascendant_lon: float) -> Dict[str, An
         ascendant_lon: Ascendant (Lagna) longitude
     
     Returns:
-        Dictionary with detected yogas and summary
+        Dictionary with detected yogas and summary (a fresh copy per call,
+        safe to modify)
     """
     # Convert planets list to dict with house/rashi info
     asc_rashi = get_rashi_from_lon(ascendant_lon)
     
-    planets = {}
+    entries = []
     for p in planets_list:
         name = p.get("name", "")
-        lon = p.get("fullDegree", p.get("full_degree", 0))
-        
-        if not name or not lon:
+        if not name:
             continue
         
-        rashi = get_rashi_from_lon(lon)
-        house = get_house_from_lon(lon, ascendant_lon)
-        
+        # 0° (start of Aries) is a valid longitude; only skip missing values
+        lon = p.get("fullDegree", p.get("full_degree"))
+        if lon is None:
+            continue
+        entries.append((name, lon))
+    
+    # Rashi and house for all planets at once (same truncation as
+    # get_rashi_from_lon / get_house_from_lon)
+    lons = np.array([lon for _, lon in entries], dtype=np.float64)
+    rashis = (lons / 30).astype(np.int64) + 1
+    houses = (((lons - ascendant_lon) % 360) / 30).astype(np.int64) + 1
+    
+    planets = {}
+    for (name, lon), rashi, house in zip(entries, rashis.tolist(), houses.tolist()):
         planets[name] = {
             "longitude": lon,
             "rashi": rashi,
@@ -301,23 +382,14 @@ def detect_yogas(planets_list: List[Dict], ascendant_lon: float) -> Dict[str, An
             "is_debilitated": is_debilitated(name, rashi),
         }
     
-    # Collect all yogas
-    all_yogas = []
-    
-    # Pancha Mahapurusha (most powerful)
-    all_yogas.extend(detect_pancha_mahapurusha(planets, asc_rashi))
-    
-    # Raja Yogas
-    all_yogas.extend(detect_raj_yogas(planets, asc_rashi))
-    
-    # Gaja Kesari
-    all_yogas.extend(detect_gaja_kesari(planets))
-    
-    # Dhana Yogas
-    all_yogas.extend(detect_dhana_yogas(planets, asc_rashi))
-    
-    # Neecha Bhanga
-    all_yogas.extend(detect_neecha_bhanga(planets))
+    # Yogas depend only on each planet's rashi and house, so charts that
+    # agree on those share one cached detection run
+    chart_key = tuple(sorted((name, p["rashi"], p["house"]) for name, p in planets.items()))
+    # Copy the shared cached dicts so callers may modify the result freely
+    all_yogas = [
+        {**yoga, "planets": list(yoga["planets"])}
+        for yoga in _detect_yogas_cached(chart_key, asc_rashi)
+    ]
     
     # Categorize by type
     yoga_categories = {}
@@ -0,0 +1,118 @@
+"""
+Yoga Detection Kernels
+
+Numeric inner loops for yoga detection. Planets are encoded by index
+(see PLANET_IDX) into fixed-length int8 arrays of rashi and house numbers,
+with 0 marking a planet that is absent from the chart.
+
+Lookup tables (house/rashi lords, qualifying and debilitation signs, kendra masks)
+are built in yogas.py and passed in, so this module has no dependency on it.
+"""
+
+import numpy as np
+
+from .jit import njit
+
+PLANET_NAMES = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+PLANET_IDX = {name: i for i, name in enumerate(PLANET_NAMES)}
+N_PLANETS = len(PLANET_NAMES)
+
+
+@njit("int64[:, :](int8[:], int8[:], int8[:], int8[:])", cache=True, error_model='numpy')
+def _raj_yoga_pairs(
+    rashi_arr: np.ndarray,
+    house_lord: np.ndarray,
+    kendra_houses: np.ndarray,
+    trikona_houses: np.ndarray,
+) -> np.ndarray:
+    """
+    Find kendra lord / trikona lord pairs placed in the same rashi.
+
+    `house_lord` is the row of planet indices lording houses 1-12 for the
+    chart's ascendant.
+
+    Returns an int64 array of shape (n, 2) with (kendra_lord, trikona_lord)
+    planet indices. A pair that qualifies both ways round (both planets
+    lord a kendra and a trikona) is reported once.
+    """
+    is_kendra_lord = np.zeros(N_PLANETS, dtype=np.bool_)
+    is_trikona_lord = np.zeros(N_PLANETS, dtype=np.bool_)
+
+    for house in kendra_houses:
+        is_kendra_lord[house_lord[house - 1]] = True
+    for house in trikona_houses:
+        is_trikona_lord[house_lord[house - 1]] = True
+
+    pairs = np.empty((N_PLANETS * N_PLANETS, 2), dtype=np.int64)
+    seen = np.zeros((N_PLANETS, N_PLANETS), dtype=np.bool_)
+    count = 0
+
+    for kl in range(N_PLANETS):
+        kl_rashi = rashi_arr[kl]
+        if not is_kendra_lord[kl] or kl_rashi == 0:
+            continue
+        for tl in range(N_PLANETS):
+            if tl == kl or not is_trikona_lord[tl] or seen[kl, tl]:
+                continue
+            # Absent planets are 0 and never match kl_rashi
+            if rashi_arr[tl] == kl_rashi:
+                seen[kl, tl] = True
+                seen[tl, kl] = True
+                pairs[count, 0] = kl
+                pairs[count, 1] = tl
+                count += 1
+
+    return pairs[:count]
+
+
+@njit("boolean[:](int8[:], int8[:], int8[:], boolean[:, :], boolean[:])", cache=True, error_model='numpy')
+def _mahapurusha_hits(
+    rashi_arr: np.ndarray,
+    house_arr: np.ndarray,
+    candidates: np.ndarray,
+    qualifies: np.ndarray,
+    kendra_mask: np.ndarray,
+) -> np.ndarray:
+    """
+    Flag candidate planets in a kendra and in their own or exaltation sign.
+
+    `qualifies[planet, rashi]` marks the own/exaltation signs per planet.
+    Returns a bool array aligned with `candidates`.
+    """
+    hits = np.zeros(candidates.shape[0], dtype=np.bool_)
+
+    for i in range(candidates.shape[0]):
+        p = candidates[i]
+        rashi = rashi_arr[p]
+        hits[i] = kendra_mask[house_arr[p]] and qualifies[p, rashi]
+
+    return hits
+
+
+@njit("int64[:, :](int8[:], int8[:], int8[:], int8[:], boolean[:])", cache=True, error_model='numpy')
+def _neecha_bhanga_pairs(
+    rashi_arr: np.ndarray,
+    house_arr: np.ndarray,
+    rashi_lord: np.ndarray,
+    debilitation: np.ndarray,
+    kendra_mask: np.ndarray,
+) -> np.ndarray:
+    """
+    Find debilitated planets whose debilitation-sign lord sits in a kendra.
+
+    Returns an int64 array of shape (n, 2) with (planet, lord) indices.
+    """
+    pairs = np.empty((N_PLANETS, 2), dtype=np.int64)
+    count = 0
+
+    for p in range(N_PLANETS):
+        rashi = rashi_arr[p]
+        if rashi == 0 or debilitation[p] != rashi:
+            continue
+        lord = rashi_lord[rashi]
+        if rashi_arr[lord] != 0 and kendra_mask[house_arr[lord]]:
+            pairs[count, 0] = p
+            pairs[count, 1] = lord
+            count += 1
+
+    return pairs[:count]
@@ -5,32 +5,26 @@ Routes requests to either internal calculation engine or FreeAstrologyAPI
 based on environment configuration.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from freeastrology.client import close_http_client
 from freeastrology.config import get_settings, AstrologyBackend
+from request_context import RequestIdMiddleware, configure_logging
+import asyncio
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-# Create FastAPI app
-app = FastAPI(
-    title="Jyotishya Astrology API",
-    description="Internal astrology calculation engine with FreeAstrologyAPI fallback",
-    version="1.0.0"
-)
-
 # Load settings
 settings = get_settings()
 
+# Configure logging (text or JSON lines, tagged with the request ID)
+configure_logging(settings.log_format)
+logger = logging.getLogger(__name__)
+
 
-@app.on_event("startup")
-async def startup_event():
-    """Log startup configuration"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Log startup configuration and warm up the calculation engine"""
     logger.info("=" * 60)
     logger.info("Jyotishya Astrology API Starting")
     logger.info(f"Backend: {settings.astrology_backend.value}")
@@ -38,11 +32,13 @@ async def startup_event():
 
     if settings.astrology_backend in (AstrologyBackend.INTERNAL, AstrologyBackend.HYBRID):
         logger.info("✅ Using INTERNAL calculation engine (Skyfield)")
+        ephemeris_ok = False
         try:
-            # Pre-load ephemeris to catch any issues early
+            # Pre-load ephemeris off the event loop to catch any issues early
             from internal.planetary import _ensure_ephemeris
-            _ensure_ephemeris()
+            await asyncio.to_thread(_ensure_ephemeris)
             logger.info("✅ Ephemeris data loaded successfully")
+            ephemeris_ok = True
         except Exception as e:
             logger.error(f"⚠️  Failed to load ephemeris: {e}")
             if settings.astrology_backend == AstrologyBackend.HYBRID:
@@ -50,6 +46,14 @@ async def startup_event():
             else:
                 logger.error("   API will still start but may fail on first request")
 
+        if ephemeris_ok:
+            try:
+                # Warm the transit position cache for the first requests
+                from internal.transits import get_current_transits
+                await asyncio.to_thread(get_current_transits)
+            except Exception as e:
+                logger.warning(f"⚠️  Transit cache warm-up failed (computed on first request instead): {e}")
+
     if settings.astrology_backend in (AstrologyBackend.FREEASTROLOGY, AstrologyBackend.HYBRID):
         logger.info("✅ External API configured: FreeAstrologyAPI.com")
         if not settings.free_api_key:
@@ -57,9 +61,38 @@ async def startup_event():
         else:
             logger.info(f"   API Key configured: {settings.free_api_key[:10]}...")
 
+    health_monitor = None
+    if settings.astrology_backend == AstrologyBackend.HYBRID:
+        # Keep a fresh external API health signal so HYBRID can skip a dead fallback
+        from services import monitor_external_api_health
+        health_monitor = asyncio.create_task(monitor_external_api_health())
+
     if settings.astrology_backend == AstrologyBackend.MOCK:
         logger.info("✅ Using MOCK data provider")
 
+    yield
+
+    if health_monitor is not None:
+        health_monitor.cancel()
+        try:
+            await health_monitor
+        except asyncio.CancelledError:
+            pass
+
+    # Release pooled keep-alive connections to the external API
+    await close_http_client()
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="Jyotishya Astrology API",
+    description="Internal astrology calculation engine with FreeAstrologyAPI fallback",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.add_middleware(RequestIdMiddleware)
+
 
 # Include routes based on backend selection
 if settings.astrology_backend in (AstrologyBackend.INTERNAL, AstrologyBackend.HYBRID):
@@ -123,7 +156,7 @@ else:
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -2,6 +2,8 @@
 from .astrology_service import (
     calculate_birth_chart,
     check_external_api_health,
+    monitor_external_api_health,
+    reload_settings,
     BackendUsed,
     AstrologyServiceError
 )
@@ -9,6 +11,8 @@ from .astrology_service import (
 __all__ = [
     "calculate_birth_chart",
     "check_external_api_health", 
+    "monitor_external_api_health",
+    "reload_settings",
     "BackendUsed",
     "AstrologyServiceError"
 ]
@@ -8,15 +8,73 @@ Production-ready service layer that:
 4. Handles errors gracefully with detailed logging
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 
-from freeastrology.config import get_settings, AstrologyBackend
+from cachetools import TTLCache
+
+from freeastrology import config
+from freeastrology.config import AstrologyBackend
 
 logger = logging.getLogger(__name__)
 
+# Internal engine (optional: the service still works with external/mock backends)
+try:
+    from internal.planetary import (
+        calculate_planet_positions_jd,
+        calculate_rahu_ketu,
+        calculate_lahiri_ayanamsha,
+        ephemeris_loaded,
+        PLANET_INDEX,
+    )
+    from internal.houses import (
+        calculate_ascendant_jd,
+        calculate_houses_whole_sign,
+        assign_planets_to_houses,
+        local_to_julian_date,
+    )
+    _INTERNAL_AVAILABLE = True
+    _INTERNAL_IMPORT_ERROR = None
+except ImportError as e:
+    _INTERNAL_AVAILABLE = False
+    _INTERNAL_IMPORT_ERROR = str(e)
+
+# Settings bound once at import; call reload_settings() after changing config
+_settings = config.get_settings()
+
+
+# Last external API health check result, refreshed by monitor_external_api_health()
+_EXTERNAL_HEALTH: Dict[str, Any] = {"ok": True, "ts": 0.0}
+_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+_HEALTH_TTL_SECONDS = 90.0  # Older results are stale and ignored
+
+
+# MOCK backend response: one immutable instance, nothing allocated per request
+_MOCK_DATA: Mapping[str, Any] = MappingProxyType({
+    "ascendant": 0.0,
+    "planets": (),
+    "houses": (),
+    "_mock": True
+})
+
+# Birth charts are pure functions of their inputs: cache finished results and
+# coalesce concurrent duplicates onto one in-flight task (single-flight)
+_CHART_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_CHART_INFLIGHT: Dict[tuple, "asyncio.Task"] = {}
+
+
+def reload_settings() -> None:
+    """Re-read settings from the environment and rebind the service's copy"""
+    global _settings
+    _settings = config.reload_settings()
+    # Cached charts may come from a backend that is no longer configured
+    _CHART_CACHE.clear()
+
 
 class BackendUsed(str, Enum):
     """Which backend actually processed the request"""
@@ -26,6 +84,10 @@ class BackendUsed(str, Enum):
     MOCK = "mock"
 
 
+# (chart_data, backend_used); chart data may be shared, so treat it as read-only
+ChartResult = Tuple[Mapping[str, Any], BackendUsed]
+
+
 class AstrologyServiceError(Exception):
     """Raised when all backends fail"""
     def __init__(self, message: str, internal_error: Optional[str] = None, external_error: Optional[str] = None):
@@ -46,116 +108,249 @@ async def calculate_birth_chart(
     timezone: float,
     observation_point: str = "topocentric",
     ayanamsha: str = "lahiri"
-) -> Tuple[Dict[str, Any], BackendUsed]:
+) -> ChartResult:
     """
     Calculate birth chart using the configured backend strategy.
     
+    Results are cached by input for an hour (except FALLBACK results, which
+    retry the internal engine next time), and identical concurrent requests
+    share one calculation. Cached chart data is shared: do not mutate it.
+    
     Returns:
         Tuple of (chart_data, backend_used)
         
     Raises:
         AstrologyServiceError: If all backends fail
     """
-    settings = get_settings()
-    backend = settings.astrology_backend
+    key = (
+        year, month, date, hours, minutes, seconds,
+        round(latitude, 4), round(longitude, 4), round(timezone, 2),
+        observation_point, ayanamsha,
+    )
     
-    internal_error = None
-    external_error = None
+    cached = _CHART_CACHE.get(key)
+    if cached is not None:
+        return cached
     
-    # Strategy: INTERNAL only
-    if backend == AstrologyBackend.INTERNAL:
-        result = await _try_internal(
+    task = _CHART_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_calculate_birth_chart_uncached(
             year, month, date, hours, minutes, seconds,
             latitude, longitude, timezone, observation_point, ayanamsha
-        )
-        if result is not None:
-            return result, BackendUsed.INTERNAL
-        raise AstrologyServiceError("Internal engine failed", internal_error="Calculation error")
+        ))
+        _CHART_INFLIGHT[key] = task
+        task.add_done_callback(lambda t: _store_chart_result(key, t))
     
-    # Strategy: EXTERNAL only
-    if backend == AstrologyBackend.FREEASTROLOGY:
-        result = await _try_external(
-            year, month, date, hours, minutes, seconds,
-            latitude, longitude, timezone, ayanamsha
-        )
-        if result is not None:
-            return result, BackendUsed.EXTERNAL
-        raise AstrologyServiceError("External API failed", external_error="API error")
+    # Shield so one cancelled caller does not cancel the shared calculation
+    return await asyncio.shield(task)
+
+
+def _store_chart_result(key: tuple, task: "asyncio.Task") -> None:
+    """Retire an in-flight chart task, caching its result if it succeeded"""
+    _CHART_INFLIGHT.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    # FALLBACK means internal just failed; don't pin the chart to the
+    # quota-limited external API for an hour, let the next request retry
+    if task.result()[1] is not BackendUsed.FALLBACK:
+        _CHART_CACHE[key] = task.result()
+
+
+async def _calculate_birth_chart_uncached(
+    year: int,
+    month: int,
+    date: int,
+    hours: int,
+    minutes: int,
+    seconds: int,
+    latitude: float,
+    longitude: float,
+    timezone: float,
+    observation_point: str,
+    ayanamsha: str
+) -> ChartResult:
+    """Run the configured backend strategy (see calculate_birth_chart)"""
+    return await _STRATEGIES[_settings.astrology_backend](
+        year, month, date, hours, minutes, seconds,
+        latitude, longitude, timezone, observation_point, ayanamsha
+    )
+
+
+async def _run_internal_only(*chart_args: Any) -> ChartResult:
+    """Strategy: INTERNAL only"""
+    try:
+        result = await _try_internal(*chart_args)
+    except Exception as e:
+        # Final error site (_calculate_internal already logged the message);
+        # traceback only when debugging, as in _run_hybrid
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Internal engine failure traceback", exc_info=e)
+        raise
+    if result is not None:
+        return result, BackendUsed.INTERNAL
+    raise AstrologyServiceError("Internal engine failed", internal_error="Calculation error")
+
+
+async def _run_external_only(*chart_args: Any) -> ChartResult:
+    """Strategy: EXTERNAL only"""
+    try:
+        result = await _try_external(*chart_args)
+    except Exception as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("External API failure traceback", exc_info=e)
+        raise
+    if result is not None:
+        return result, BackendUsed.EXTERNAL
+    raise AstrologyServiceError("External API failed", external_error="API error")
+
+
+async def _run_hybrid(*chart_args: Any) -> ChartResult:
+    """Strategy: HYBRID (internal first, external hedged after a short delay)"""
+    internal_error = None
+    external_error = None
     
-    # Strategy: HYBRID (internal first, fallback to external)
-    if backend == AstrologyBackend.HYBRID:
-        # Try internal first
-        try:
-            result = await _try_internal(
-                year, month, date, hours, minutes, seconds,
-                latitude, longitude, timezone, observation_point, ayanamsha
-            )
-            if result is not None:
-                return result, BackendUsed.INTERNAL
-        except Exception as e:
-            internal_error = str(e)
-            logger.warning(f"Internal engine failed, trying external: {e}")
-        
-        # Fallback to external
-        try:
-            result = await _try_external(
-                year, month, date, hours, minutes, seconds,
-                latitude, longitude, timezone, ayanamsha
-            )
-            if result is not None:
-                logger.info("Successfully used external API as fallback")
-                return result, BackendUsed.FALLBACK
-        except Exception as e:
-            external_error = str(e)
-            logger.error(f"External API also failed: {e}")
+    t_int = asyncio.create_task(_try_internal(*chart_args))
+    t_ext: Optional[asyncio.Task] = None
+    
+    # No hedge while the ephemeris is cold: a slow first load is not a failure,
+    # and every hedged call spends the external API's daily quota
+    hedge_delay = _settings.hybrid_hedge_delay_seconds if _INTERNAL_AVAILABLE and ephemeris_loaded() else None
+    
+    try:
+        # Give internal a head start; external only starts if it is slow or fails
+        done, pending = await asyncio.wait({t_int}, timeout=hedge_delay)
         
-        raise AstrologyServiceError(
-            "All backends failed",
-            internal_error=internal_error,
-            external_error=external_error
-        )
+        while True:
+            # Check internal first so it wins when both finish together
+            for task in sorted(done, key=lambda t: t is not t_int):
+                result, error = _task_outcome(task)
+                if result is not None:
+                    if task is t_int:
+                        return result, BackendUsed.INTERNAL
+                    logger.info("Successfully used external API as fallback", extra={"backend": "external"})
+                    return result, BackendUsed.FALLBACK
+                if task is t_int:
+                    internal_error = error
+                    logger.warning(
+                        "Internal engine failed, trying external: %s", error,
+                        extra={"backend": "internal", "err": error},
+                    )
+                else:
+                    external_error = error
+                    logger.error(
+                        "External API failed: %s", error,
+                        extra={"backend": "external", "err": error},
+                    )
+            
+            if t_ext is None and external_error is None:
+                if _external_api_down():
+                    # Skip a call that would only time out
+                    external_error = "External API unavailable (health check failed)"
+                else:
+                    t_ext = asyncio.create_task(_try_external(*chart_args))
+                    pending.add(t_ext)
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Cancel whichever backend lost the race
+        for backend_task in (t_int, t_ext):
+            if backend_task is not None and not backend_task.done():
+                backend_task.cancel()
+    
+    # Tracebacks only once everything failed, and only when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        for label, backend_task in (("Internal engine", t_int), ("External API", t_ext)):
+            if backend_task is not None and not backend_task.cancelled() and backend_task.exception() is not None:
+                logger.debug("%s failure traceback", label, exc_info=backend_task.exception())
     
-    # Strategy: MOCK
+    raise AstrologyServiceError(
+        "All backends failed",
+        internal_error=internal_error,
+        external_error=external_error
+    )
+
+
+async def _run_mock(*chart_args: Any) -> ChartResult:
+    """Strategy: MOCK"""
     return _get_mock_data(), BackendUsed.MOCK
 
 
+# Backend strategy per configured AstrologyBackend; all share one signature
+_STRATEGIES: Dict[AstrologyBackend, Callable[..., Awaitable[ChartResult]]] = {
+    AstrologyBackend.INTERNAL: _run_internal_only,
+    AstrologyBackend.FREEASTROLOGY: _run_external_only,
+    AstrologyBackend.HYBRID: _run_hybrid,
+    AstrologyBackend.MOCK: _run_mock,
+}
+
+
+def _task_outcome(task: "asyncio.Task") -> Tuple[Optional[Mapping[str, Any]], Optional[str]]:
+    """Return (result, error) for a finished backend task"""
+    if task.cancelled():
+        return None, "Cancelled"
+    exc = task.exception()
+    if exc is not None:
+        return None, str(exc)
+    return task.result(), None
+
+
 async def _try_internal(
     year: int, month: int, date: int,
     hours: int, minutes: int, seconds: int,
     latitude: float, longitude: float, timezone: float,
     observation_point: str, ayanamsha: str
 ) -> Optional[Dict[str, Any]]:
-    """Try calculating with internal Skyfield engine"""
+    """Try calculating with internal Skyfield engine (in a worker thread)"""
+    # CPU-bound: run off the event loop so HYBRID can race the external API
+    return await asyncio.to_thread(
+        _calculate_internal,
+        year, month, date, hours, minutes, seconds,
+        latitude, longitude, timezone, observation_point, ayanamsha
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_jd(
+    year: int, month: int, date: int,
+    hours: int, minutes: int, seconds: int,
+    timezone: float
+) -> float:
+    """Julian Date (UTC) for local birth time; ValueError if the date is invalid"""
+    return local_to_julian_date(year, month, date, hours, minutes, seconds, timezone)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_ayanamsha(jd_rounded: float) -> float:
+    """Lahiri ayanamsha at a JD rounded to 5 decimals (~1s; it drifts ~50"/year)"""
+    return calculate_lahiri_ayanamsha(jd_rounded)
+
+
+def _calculate_internal(
+    year: int, month: int, date: int,
+    hours: int, minutes: int, seconds: int,
+    latitude: float, longitude: float, timezone: float,
+    observation_point: str, ayanamsha: str
+) -> Optional[Dict[str, Any]]:
+    """Calculate a birth chart with the internal Skyfield engine"""
     try:
-        from internal.planetary import calculate_planet_positions, calculate_rahu_ketu
-        from internal.houses import (
-            calculate_ascendant,
-            calculate_houses_whole_sign,
-            assign_planets_to_houses,
-            datetime_to_julian_date,
-            calculate_lahiri_ayanamsha
-        )
-        from datetime import timedelta
+        if not _INTERNAL_AVAILABLE:
+            raise ImportError(f"Internal engine unavailable: {_INTERNAL_IMPORT_ERROR}")
         
-        # Build datetime
-        local_dt = datetime(year, month, date, hours, minutes, seconds)
-        utc_dt = local_dt - timedelta(hours=timezone)
+        # Local time straight to Julian Date (UTC)
+        jd = _compute_jd(year, month, date, hours, minutes, seconds, timezone)
         
         # Calculate chart
-        jd = datetime_to_julian_date(utc_dt)
-        ayanamsha_value = calculate_lahiri_ayanamsha(jd)
+        ayanamsha_value = _compute_ayanamsha(round(jd, 5))
         
-        planets = calculate_planet_positions(utc_dt, latitude, longitude, ayanamsha)
-        ascendant = calculate_ascendant(utc_dt, latitude, longitude, ayanamsha_value)
+        planets = calculate_planet_positions_jd(jd, latitude, longitude, ayanamsha)
+        ascendant = calculate_ascendant_jd(jd, latitude, longitude, ayanamsha_value)
         houses = calculate_houses_whole_sign(ascendant)
-        planets = assign_planets_to_houses(planets, houses, 'whole_sign')
         
-        # Add Rahu/Ketu
-        moon = next((p for p in planets if p['name'] == 'Moon'), None)
-        if moon:
-            rahu, ketu = calculate_rahu_ketu(moon)
-            rahu_ketu = assign_planets_to_houses([rahu, ketu], houses, 'whole_sign')
-            planets.extend(rahu_ketu)
+        # Add Rahu/Ketu, then assign houses to all bodies in one pass
+        moon = planets[PLANET_INDEX['Moon']]
+        planets.extend(calculate_rahu_ketu(moon))
+        planets = assign_planets_to_houses(planets, houses, 'whole_sign')
         
         return {
             "ascendant": ascendant,
@@ -163,7 +358,8 @@ async def _try_internal(
             "houses": houses
         }
     except Exception as e:
-        logger.error(f"Internal calculation error: {e}", exc_info=True)
+        # No traceback here: HYBRID may recover (see _run_hybrid)
+        logger.warning("Internal calculation error: %s", e, extra={"backend": "internal", "err": str(e)})
         raise
 
 
@@ -171,54 +367,60 @@ async def _try_external(
     year: int, month: int, date: int,
     hours: int, minutes: int, seconds: int,
     latitude: float, longitude: float, timezone: float,
-    ayanamsha: str
-) -> Optional[Dict[str, Any]]:
-    """Try calculating with external FreeAstrologyAPI"""
+    observation_point: str, ayanamsha: str
+) -> Optional[Mapping[str, Any]]:
+    """Try calculating with external FreeAstrologyAPI (observation_point is not sent)"""
     try:
-        from freeastrology.client import FreeAstrologyApiClient
+        from freeastrology.client import FreeAstrologyApiClient, ExternalPayload
         
         client = FreeAstrologyApiClient()
         
         # FreeAstrologyAPI expects specific payload format
-        payload = {
-            "year": year,
-            "month": month,
-            "date": date,
-            "hours": hours,
-            "minutes": minutes,
-            "seconds": seconds,
-            "latitude": latitude,
-            "longitude": longitude,
-            "timezone": timezone,
-            "ayanamsa": ayanamsha
-        }
+        payload = ExternalPayload(
+            year, month, date, hours, minutes, seconds,
+            latitude, longitude, timezone, ayanamsha
+        )
         
         # Note: This is a simplified call - actual implementation may need adjustment
         result = await client._post("/planets", payload)
         return result
     except Exception as e:
-        logger.error(f"External API error: {e}", exc_info=True)
+        logger.warning("External API error: %s", e, extra={"backend": "external", "err": str(e)})
         raise
 
 
-def _get_mock_data() -> Dict[str, Any]:
-    """Return mock data for testing"""
-    return {
-        "ascendant": 0.0,
-        "planets": [],
-        "houses": [],
-        "_mock": True
-    }
+def _get_mock_data() -> Mapping[str, Any]:
+    """Return mock data for testing (shared and read-only)"""
+    return _MOCK_DATA
 
 
 async def check_external_api_health() -> bool:
-    """Check if external API is available"""
+    """Check if external API is available (and record the result)"""
     try:
-        import httpx
-        settings = get_settings()
+        from freeastrology.client import get_http_client
         
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{settings.free_api_base_url}/")
-            return response.status_code < 500
+        client = get_http_client()
+        response = await client.get(f"{_settings.free_api_base_url}/", timeout=5.0)
+        ok = response.status_code < 500
     except Exception:
+        ok = False
+    
+    _EXTERNAL_HEALTH["ok"] = ok
+    _EXTERNAL_HEALTH["ts"] = time.monotonic()
+    return ok
+
+
+def _external_api_down() -> bool:
+    """True if a recent health check found the external API down"""
+    if _EXTERNAL_HEALTH["ok"]:
         return False
+    return time.monotonic() - _EXTERNAL_HEALTH["ts"] < _HEALTH_TTL_SECONDS
+
+
+async def monitor_external_api_health(interval: float = _HEALTH_CHECK_INTERVAL_SECONDS) -> None:
+    """Refresh the external API health status until cancelled"""
+    while True:
+        ok = await check_external_api_health()
+        if not ok:
+            logger.warning("External API health check failed; HYBRID fallback disabled", extra={"backend": "external"})
+        await asyncio.sleep(interval)
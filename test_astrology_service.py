@@ -0,0 +1,273 @@
+"""
+Astrology Service Tests
+
+Backend strategies with _try_internal/_try_external stubbed out, so no
+ephemeris or network access is needed.
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from freeastrology.config import AstrologyBackend
+from services import astrology_service as service
+from services.astrology_service import AstrologyServiceError, BackendUsed
+
+CHART_ARGS = (1990, 5, 1, 10, 0, 0, 28.6139, 77.209, 5.5, "topocentric", "lahiri")
+
+
+class StubBackend:
+    """Backend stand-in: sleeps, then returns a chart or raises, recording what happened"""
+
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    async def __call__(self, *chart_args):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return {"source": self.name}
+
+
+@pytest.fixture(autouse=True)
+def isolated_service(monkeypatch):
+    """Fresh cache and health state, warm ephemeris, HYBRID with a short hedge delay"""
+    monkeypatch.setattr(service, "_settings", service._settings.model_copy(update={
+        "astrology_backend": AstrologyBackend.HYBRID,
+        "hybrid_hedge_delay_seconds": 0.05,
+    }))
+    monkeypatch.setattr(service, "_EXTERNAL_HEALTH", {"ok": True, "ts": 0.0})
+    monkeypatch.setattr(service, "ephemeris_loaded", lambda: True)
+    service._CHART_CACHE.clear()
+    yield
+    service._CHART_CACHE.clear()
+    service._CHART_INFLIGHT.clear()
+
+
+def _use_backends(monkeypatch, internal, external):
+    monkeypatch.setattr(service, "_try_internal", internal)
+    monkeypatch.setattr(service, "_try_external", external)
+
+
+def _race(internal, external):
+    """Run _run_hybrid; also report which stubs were cancelled before the loop closed"""
+    async def race():
+        result, backend = await service._run_hybrid(*CHART_ARGS)
+        await asyncio.sleep(0)  # let a cancelled loser see its CancelledError
+        return result["source"], backend, (internal.cancelled, external.cancelled)
+
+    # asyncio.run cancels leftover tasks itself, so check the snapshot instead
+    return asyncio.run(race())
+
+
+# ==============================================================================
+# HYBRID STRATEGY
+# ==============================================================================
+
+def test_hybrid_fast_internal_never_starts_external(monkeypatch):
+    internal, external = StubBackend("internal", 0.01), StubBackend("external")
+    _use_backends(monkeypatch, internal, external)
+
+    source, backend, _ = _race(internal, external)
+
+    assert (source, backend) == ("internal", BackendUsed.INTERNAL)
+    assert external.calls == 0
+
+
+def test_hybrid_slow_internal_loses_to_external(monkeypatch):
+    internal, external = StubBackend("internal", 1.0), StubBackend("external", 0.01)
+    _use_backends(monkeypatch, internal, external)
+
+    start = time.perf_counter()
+    source, backend, cancelled = _race(internal, external)
+
+    assert (source, backend) == ("external", BackendUsed.FALLBACK)
+    assert cancelled == (True, False)
+    assert time.perf_counter() - start < 0.5
+
+
+def test_hybrid_internal_wins_after_hedge_and_cancels_external(monkeypatch):
+    internal, external = StubBackend("internal", 0.1), StubBackend("external", 1.0)
+    _use_backends(monkeypatch, internal, external)
+
+    source, backend, cancelled = _race(internal, external)
+
+    assert (source, backend) == ("internal", BackendUsed.INTERNAL)
+    assert external.calls == 1
+    assert cancelled == (False, True)
+
+
+def test_hybrid_waits_for_cold_ephemeris_without_hedging(monkeypatch):
+    monkeypatch.setattr(service, "ephemeris_loaded", lambda: False)
+    internal, external = StubBackend("internal", 0.2), StubBackend("external", 0.01)
+    _use_backends(monkeypatch, internal, external)
+
+    source, backend, _ = _race(internal, external)
+
+    assert (source, backend) == ("internal", BackendUsed.INTERNAL)
+    assert external.calls == 0
+
+
+def test_hybrid_internal_failure_starts_external_immediately(monkeypatch):
+    monkeypatch.setattr(service, "_settings", service._settings.model_copy(update={
+        "hybrid_hedge_delay_seconds": 5.0,
+    }))
+    internal, external = StubBackend("internal", fail=True), StubBackend("external", 0.01)
+    _use_backends(monkeypatch, internal, external)
+
+    start = time.perf_counter()
+    source, backend, _ = _race(internal, external)
+
+    assert (source, backend) == ("external", BackendUsed.FALLBACK)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_hybrid_both_failing_raises_with_both_errors(monkeypatch):
+    internal, external = StubBackend("internal", fail=True), StubBackend("external", fail=True)
+    _use_backends(monkeypatch, internal, external)
+
+    with pytest.raises(AstrologyServiceError) as exc_info:
+        asyncio.run(service._run_hybrid(*CHART_ARGS))
+
+    assert exc_info.value.internal_error == "internal failed"
+    assert exc_info.value.external_error == "external failed"
+
+
+# ==============================================================================
+# EXTERNAL API HEALTH
+# ==============================================================================
+
+def test_hybrid_skips_external_marked_unhealthy(monkeypatch):
+    monkeypatch.setattr(service, "_EXTERNAL_HEALTH", {"ok": False, "ts": time.monotonic()})
+    internal, external = StubBackend("internal", fail=True), StubBackend("external")
+    _use_backends(monkeypatch, internal, external)
+
+    with pytest.raises(AstrologyServiceError) as exc_info:
+        asyncio.run(service._run_hybrid(*CHART_ARGS))
+
+    assert external.calls == 0
+    assert "health check" in exc_info.value.external_error
+
+
+def test_hybrid_ignores_stale_unhealthy_result(monkeypatch):
+    stale = time.monotonic() - service._HEALTH_TTL_SECONDS - 1
+    monkeypatch.setattr(service, "_EXTERNAL_HEALTH", {"ok": False, "ts": stale})
+    internal, external = StubBackend("internal", fail=True), StubBackend("external")
+    _use_backends(monkeypatch, internal, external)
+
+    source, backend, _ = _race(internal, external)
+
+    assert (source, backend) == ("external", BackendUsed.FALLBACK)
+
+
+# ==============================================================================
+# CHART CACHE AND SINGLE-FLIGHT
+# ==============================================================================
+
+def _internal_only(monkeypatch, internal):
+    monkeypatch.setattr(service, "_settings", service._settings.model_copy(update={
+        "astrology_backend": AstrologyBackend.INTERNAL,
+    }))
+    _use_backends(monkeypatch, internal, StubBackend("external"))
+
+
+def test_concurrent_identical_requests_share_one_calculation(monkeypatch):
+    internal = StubBackend("internal", 0.05)
+    _internal_only(monkeypatch, internal)
+
+    async def requests():
+        concurrent = await asyncio.gather(*(service.calculate_birth_chart(*CHART_ARGS) for _ in range(5)))
+        later = await service.calculate_birth_chart(*CHART_ARGS)
+        return concurrent, later
+
+    concurrent, later = asyncio.run(requests())
+
+    assert internal.calls == 1
+    assert all(outcome == (later[0], BackendUsed.INTERNAL) for outcome in concurrent)
+    assert later[0] == {"source": "internal"}
+
+
+def test_cancelled_waiter_does_not_cancel_shared_calculation(monkeypatch):
+    internal = StubBackend("internal", 0.05)
+    _internal_only(monkeypatch, internal)
+
+    async def requests():
+        first = asyncio.create_task(service.calculate_birth_chart(*CHART_ARGS))
+        second = asyncio.create_task(service.calculate_birth_chart(*CHART_ARGS))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        result = await second
+        return first.cancelled(), result
+
+    first_cancelled, result = asyncio.run(requests())
+
+    assert first_cancelled
+    assert result == ({"source": "internal"}, BackendUsed.INTERNAL)
+    assert internal.calls == 1
+    assert not internal.cancelled
+
+
+def test_failures_are_not_cached(monkeypatch):
+    internal = StubBackend("internal", fail=True)
+    _internal_only(monkeypatch, internal)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.calculate_birth_chart(*CHART_ARGS))
+
+    internal.fail = False
+    result, backend = asyncio.run(service.calculate_birth_chart(*CHART_ARGS))
+
+    assert (result, backend) == ({"source": "internal"}, BackendUsed.INTERNAL)
+    assert internal.calls == 2
+    assert not service._CHART_INFLIGHT
+
+
+def test_fallback_results_are_not_cached(monkeypatch):
+    internal, external = StubBackend("internal", fail=True), StubBackend("external")
+    _use_backends(monkeypatch, internal, external)
+
+    first = asyncio.run(service.calculate_birth_chart(*CHART_ARGS))
+    internal.fail = False
+    second = asyncio.run(service.calculate_birth_chart(*CHART_ARGS))
+    third = asyncio.run(service.calculate_birth_chart(*CHART_ARGS))
+
+    assert first == ({"source": "external"}, BackendUsed.FALLBACK)
+    assert second == third == ({"source": "internal"}, BackendUsed.INTERNAL)
+    assert (internal.calls, external.calls) == (2, 1)
+
+
+# ==============================================================================
+# ERROR LOGGING
+# ==============================================================================
+
+@pytest.mark.parametrize("backend, failing", [
+    (AstrologyBackend.INTERNAL, "_try_internal"),
+    (AstrologyBackend.FREEASTROLOGY, "_try_external"),
+])
+@pytest.mark.parametrize("level, tracebacks", [(logging.INFO, 0), (logging.DEBUG, 1)])
+def test_single_backend_failure_traceback_only_when_debugging(
+    monkeypatch, caplog, backend, failing, level, tracebacks
+):
+    monkeypatch.setattr(service, "_settings", service._settings.model_copy(update={
+        "astrology_backend": backend,
+    }))
+    monkeypatch.setattr(service, failing, StubBackend("backend", fail=True))
+    caplog.set_level(level, logger=service.logger.name)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.calculate_birth_chart(*CHART_ARGS))
+
+    with_traceback = [r for r in caplog.records if r.exc_info]
+    assert len(with_traceback) == tracebacks
+    assert all(r.levelname == "DEBUG" for r in with_traceback)
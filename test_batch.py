@@ -0,0 +1,64 @@
+"""
+Batch Birth Chart Tests
+
+Checks /chart/batch results against the single-chart engine functions.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from internal.batch import calculate_birth_charts_batch
+from internal.houses import calculate_ascendant, datetime_to_julian_date
+from internal.planetary import calculate_planet_positions, calculate_lahiri_ayanamsha
+from router import app
+
+BIRTHS = [
+    # Historical dates, where UTC and UT1 differ by tens of seconds
+    dict(year=1900, month=3, date=1, hours=5, minutes=30, seconds=0,
+         latitude=28.6139, longitude=77.209, timezone=5.5),
+    dict(year=1950, month=6, date=15, hours=23, minutes=59, seconds=59,
+         latitude=-33.87, longitude=151.21, timezone=10.0),
+    dict(year=1990, month=1, date=1, hours=0, minutes=15, seconds=0,
+         latitude=40.71, longitude=-74.0, timezone=-5.0),
+    dict(year=2024, month=2, date=29, hours=12, minutes=0, seconds=30,
+         latitude=51.5, longitude=-0.12, timezone=0.0),
+]
+
+
+def _single_chart(birth):
+    """Ascendant and planets the way /planets computes them"""
+    local_dt = datetime(
+        birth['year'], birth['month'], birth['date'],
+        birth['hours'], birth['minutes'], birth['seconds'],
+    )
+    utc_dt = local_dt - timedelta(hours=birth['timezone'])
+    ayanamsha = calculate_lahiri_ayanamsha(datetime_to_julian_date(utc_dt))
+    planets = calculate_planet_positions(utc_dt, birth['latitude'], birth['longitude'])
+    ascendant = calculate_ascendant(utc_dt, birth['latitude'], birth['longitude'], ayanamsha)
+    return ascendant, planets
+
+
+def test_batch_matches_single_chart():
+    charts = calculate_birth_charts_batch(BIRTHS)
+
+    assert len(charts) == len(BIRTHS)
+    for birth, chart in zip(BIRTHS, charts):
+        ascendant, planets = _single_chart(birth)
+        assert chart['ascendant'] == pytest.approx(ascendant, abs=1e-9)
+        for expected in planets:
+            actual = next(p for p in chart['planets'] if p['name'] == expected['name'])
+            assert actual['fullDegree'] == pytest.approx(expected['fullDegree'], abs=1e-6)
+            assert actual['speed'] == pytest.approx(expected['speed'], abs=1e-6)
+            assert actual['sign'] == expected['sign']
+
+
+def test_batch_rejects_impossible_date():
+    births = BIRTHS + [dict(BIRTHS[0], month=2, date=31)]
+
+    with pytest.raises(ValueError, match="chart 4"):
+        calculate_birth_charts_batch(births)
+
+    response = TestClient(app).post("/chart/batch", json={"charts": births})
+    assert response.status_code == 400
@@ -0,0 +1,66 @@
+"""
+Divisional Chart Endpoint Tests
+
+The NDJSON stream must carry the same charts as the regular response, and
+fail as visibly.
+"""
+
+import orjson
+from fastapi.testclient import TestClient
+
+from internal.routes import _stream_divisional_charts
+from router import app
+
+PLANETS = [
+    {"name": "Sun", "fullDegree": 123.4},
+    {"name": "Moon", "fullDegree": 301.25},
+    {"name": "Mars", "fullDegree": 0.5},
+    {"name": "Saturn", "fullDegree": 359.99},
+]
+
+
+def test_divisional_charts_stream_matches_response():
+    client = TestClient(app)
+    body = {"planets": PLANETS, "ascendant_longitude": 45.5}
+
+    expected = client.post("/divisional-charts", json=body).json()
+    response = client.post("/divisional-charts", json={**body, "stream": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    *chart_lines, summary = lines
+
+    assert [line.pop("chart") for line in chart_lines] == list(expected["charts"])
+    assert chart_lines == list(expected["charts"].values())
+    assert summary == {
+        "available_charts": expected["available_charts"],
+        "primary_charts": expected["primary_charts"],
+        "backend": "internal",
+    }
+
+
+def test_divisional_charts_rejects_bad_longitude_before_streaming():
+    client = TestClient(app)
+    body = {"planets": PLANETS + [{"name": "Venus", "fullDegree": "abc"}], "ascendant_longitude": 45.5}
+
+    plain = client.post("/divisional-charts", json=body)
+    streamed = client.post("/divisional-charts", json={**body, "stream": True})
+
+    assert plain.status_code == streamed.status_code == 400
+    assert plain.json() == streamed.json()
+    assert "Venus" in streamed.json()["detail"]
+
+
+def test_divisional_stream_ends_with_error_line_on_mid_stream_failure():
+    def charts():
+        yield "D1", {"name": "Rashi"}
+        raise RuntimeError("boom")
+
+    lines = [orjson.loads(line) for line in _stream_divisional_charts(charts())]
+
+    assert lines == [
+        {"chart": "D1", "name": "Rashi"},
+        {"error": "Failed to calculate divisional charts: boom"},
+    ]
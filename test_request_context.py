@@ -0,0 +1,61 @@
+"""
+Request ID Middleware and JSON Log Format Tests
+"""
+
+import logging
+import sys
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from request_context import JsonFormatter, RequestIdMiddleware, request_id_var
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/whoami")
+    async def whoami():
+        return {"request_id": request_id_var.get()}
+
+    return TestClient(app)
+
+
+def test_incoming_request_id_is_echoed():
+    response = _client().get("/whoami", headers={"X-Request-ID": "abc-123"})
+
+    assert response.headers["X-Request-ID"] == "abc-123"
+    assert response.json() == {"request_id": "abc-123"}
+
+
+def test_request_id_generated_when_missing_or_invalid():
+    client = _client()
+
+    for headers in ({}, {"X-Request-ID": "bad id\twith spaces"}):
+        response = client.get("/whoami", headers=headers)
+        request_id = response.headers["X-Request-ID"]
+        assert len(request_id) == 32 and request_id != "bad id\twith spaces"
+        assert response.json() == {"request_id": request_id}
+
+    assert request_id_var.get() == "-"
+
+
+def test_json_formatter_includes_request_id_extra_and_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "failed for %s", ("chart",), sys.exc_info()
+        )
+    record.request_id = "req-1"
+    record.backend = "internal"
+
+    entry = orjson.loads(JsonFormatter().format(record))
+
+    assert entry["msg"] == "failed for chart"
+    assert entry["level"] == "ERROR"
+    assert entry["request_id"] == "req-1"
+    assert entry["backend"] == "internal"
+    assert "ValueError: boom" in entry["exc"]
@@ -0,0 +1,49 @@
+"""
+Horoscope Guidance Template Tests
+
+get_all_guidance must pick the same texts as the per-sign get_*_guidance
+functions.
+"""
+
+import random
+
+from internal.horoscope import ZODIAC_SIGNS
+from internal.templates import (
+    get_all_guidance,
+    get_career_guidance,
+    get_health_guidance,
+    get_overall_guidance,
+    get_relationship_guidance,
+)
+
+PLANETS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+ASPECTS = ("conjunction", "sextile", "square", "trine", "opposition", "neutral")
+
+
+def _transits(rng):
+    """Random transit aspects, with degrees just below a whole degree"""
+    return {
+        planet: {
+            "sign": "Aries",
+            "degree": rng.randrange(30) + rng.choice((0.0, 0.5, 0.99, 0.9999999)),
+            "aspect": rng.choice(ASPECTS),
+            "is_retro": rng.random() < 0.2,
+        }
+        for planet in PLANETS
+    }
+
+
+def test_all_guidance_matches_per_sign_functions():
+    rng = random.Random(7)
+    transits_by_sign = {sign.lower(): _transits(rng) for sign in ZODIAC_SIGNS}
+
+    guidance = get_all_guidance(transits_by_sign)
+
+    for sign in ZODIAC_SIGNS:
+        transits = transits_by_sign[sign.lower()]
+        assert guidance[sign.lower()] == {
+            "overall": get_overall_guidance(transits, sign),
+            "career": get_career_guidance(transits, sign),
+            "relationships": get_relationship_guidance(transits, sign),
+            "health": get_health_guidance(transits, sign),
+        }
@@ -0,0 +1,47 @@
+"""
+Transit Aspect Classification Tests
+
+The Numba kernel and its NumPy fallback must classify every pair exactly
+as calculate_aspect does.
+"""
+
+import numpy as np
+import pytest
+
+from internal.transits import (
+    ASPECTS,
+    ASPECT_IDS,
+    _CANDIDATE_BY_DEGREE,
+    _ORB_TABLE,
+    _classify_aspects_jit,
+    _classify_aspects_vectorized,
+    calculate_aspect,
+)
+
+
+def _edge_pairs():
+    """Separations exactly on, just inside and just outside every orb, both ways round 0/360"""
+    pairs = []
+    for natal in (0.0, 10.0, 359.5, 179.25):
+        for data in ASPECTS.values():
+            for edge in (data["angle"] - data["orb"], data["angle"] + data["orb"]):
+                for sep in (edge - 1e-9, edge, edge + 1e-9):
+                    pairs.append(((natal + sep) % 360.0, natal))
+                    pairs.append(((natal - sep) % 360.0, natal))
+    return pairs
+
+
+@pytest.mark.parametrize("classify", [_classify_aspects_jit, _classify_aspects_vectorized])
+def test_classifier_matches_calculate_aspect(classify):
+    rng = np.random.default_rng(42)
+    edge_transit, edge_natal = map(np.array, zip(*_edge_pairs()))
+    transit_lons = np.concatenate([rng.uniform(0, 360, 40), edge_transit, [0.0, 360.0]])
+    natal_lons = np.concatenate([rng.uniform(0, 360, 40), edge_natal, [0.0, 360.0]])
+
+    aspect_ids = classify(transit_lons, natal_lons, _ORB_TABLE, _CANDIDATE_BY_DEGREE)
+
+    for i, transit_lon in enumerate(transit_lons):
+        for j, natal_lon in enumerate(natal_lons):
+            expected = calculate_aspect(float(transit_lon), float(natal_lon))
+            actual = ASPECT_IDS[aspect_ids[i, j] - 1] if aspect_ids[i, j] else None
+            assert actual == (expected["aspect"] if expected else None), (transit_lon, natal_lon)
@@ -168,6 +168,30 @@ def test_sign_nakshatra_lookup():
     print("\n✅ Lookup tables passed")
 
 
+def test_yogas_planet_at_zero_degrees():
+    """Test that a planet at exactly 0° is included in yoga detection"""
+    print("\n" + "="*60)
+    print("Test: Yogas With Planet at 0° Aries")
+    print("="*60)
+
+    from internal.yogas import detect_yogas
+
+    # Sun at 0° Aries (exalted), Aries ascendant
+    planets = [
+        {"name": "Sun", "fullDegree": 0.0},
+        {"name": "Moon", "fullDegree": 45.0},
+    ]
+    result = detect_yogas(planets, ascendant_lon=0.0)
+
+    print(f"Planets detected: {list(result['planets'])}")
+
+    assert "Sun" in result["planets"], "Sun at 0° should not be dropped"
+    assert result["planets"]["Sun"]["rashi"] == 1
+    assert result["planets"]["Sun"]["is_exalted"]
+
+    print("\n✅ Zero-degree planet handling passed")
+
+
 def run_all_tests():
     """Run all validation tests"""
     print("\n" + "="*60)
@@ -179,6 +203,7 @@ def run_all_tests():
         test_sign_nakshatra_lookup()
         test_houses()
         test_birth_chart()
+        test_yogas_planet_at_zero_degrees()
 
         print("\n" + "="*60)
         print("✅ ALL TESTS PASSED")